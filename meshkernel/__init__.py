@@ -1,6 +1,6 @@
 # If you change these imports,
 # do not forget to sync the docs at "docs/api"
-from meshkernel.errors import InputError, MeshKernelError
+from meshkernel.errors import InputError, MeshGeometryError, MeshKernelError
 from meshkernel.meshkernel import MeshKernel
 from meshkernel.py_structures import (
     AveragingMethod,
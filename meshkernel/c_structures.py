@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from ctypes import POINTER, Structure, c_double, c_int, c_void_p
+from functools import lru_cache
+from operator import attrgetter
 
 import numpy as np
-from numpy.ctypeslib import as_ctypes
 
 from meshkernel.errors import InputError
 from meshkernel.py_structures import (
@@ -22,6 +23,60 @@ from meshkernel.py_structures import (
 from meshkernel.utils import to_contiguous_numpy_array
 
 
+def _as_c_pointer(array: np.ndarray, dtype: type, c_type: type, owners: list):
+    """Gets a pointer to the data of an array, converting it only if its dtype or layout does not fit.
+
+    Args:
+        array (np.ndarray): The array.
+        dtype (type): The dtype the C API expects.
+        c_type (type): The ctypes type the C API expects.
+        owners (list): The list the passed array is appended to, to keep it alive as long as the pointer.
+
+    Returns:
+        The pointer to the data of the (converted) array.
+    """
+    if not (array.flags.c_contiguous and array.dtype == dtype):
+        array = np.ascontiguousarray(array, dtype=dtype)
+    owners.append(array)
+    return array.ctypes.data_as(POINTER(c_type))
+
+
+def _as_c_double_ptr(array: np.ndarray, owners: list):
+    """Gets a `POINTER(c_double)` to the data of an array, see `_as_c_pointer`."""
+    return _as_c_pointer(array, np.double, c_double, owners)
+
+
+def _as_c_int_ptr(array: np.ndarray, owners: list):
+    """Gets a `POINTER(c_int)` to the data of an array, see `_as_c_pointer`."""
+    return _as_c_pointer(array, np.int32, c_int, owners)
+
+
+@lru_cache(maxsize=None)
+def _field_getter(structure_type: type) -> attrgetter:
+    """Gets a getter reading the fields of a parameter C-structure from a Python parameter object.
+
+    Args:
+        structure_type (type): The C-structure class.
+
+    Returns:
+        attrgetter: The getter returning the field values, in the order of ``_fields_``.
+    """
+    return attrgetter(*(name for name, _ in structure_type._fields_))
+
+
+def _parameters_from(structure_type: type, parameters) -> Structure:
+    """Gets the parameter C-structure holding the values of a Python parameter object.
+
+    Args:
+        structure_type (type): The C-structure class.
+        parameters: The Python parameter object, with an attribute per field of the C-structure.
+
+    Returns:
+        Structure: A new C-structure holding the parameter values.
+    """
+    return structure_type(*_field_getter(structure_type)(parameters))
+
+
 class CMesh2d(Structure):
     """C-structure intended for internal use only.
     It represents a Mesh2D struct as described by the MeshKernel API.
@@ -93,19 +148,21 @@ class CMesh2d(Structure):
             )
 
         c_mesh2d = CMesh2d()
+        owners = []
 
         # Set the pointers
-        c_mesh2d.edge_faces = as_ctypes(mesh2d.edge_faces)
-        c_mesh2d.edge_nodes = as_ctypes(mesh2d.edge_nodes)
-        c_mesh2d.face_edges = as_ctypes(mesh2d.face_edges)
-        c_mesh2d.face_nodes = as_ctypes(mesh2d.face_nodes)
-        c_mesh2d.nodes_per_face = as_ctypes(mesh2d.nodes_per_face)
-        c_mesh2d.node_x = as_ctypes(mesh2d.node_x)
-        c_mesh2d.node_y = as_ctypes(mesh2d.node_y)
-        c_mesh2d.edge_x = as_ctypes(mesh2d.edge_x)
-        c_mesh2d.edge_y = as_ctypes(mesh2d.edge_y)
-        c_mesh2d.face_x = as_ctypes(mesh2d.face_x)
-        c_mesh2d.face_y = as_ctypes(mesh2d.face_y)
+        c_mesh2d.edge_faces = _as_c_int_ptr(mesh2d.edge_faces, owners)
+        c_mesh2d.edge_nodes = _as_c_int_ptr(mesh2d.edge_nodes, owners)
+        c_mesh2d.face_edges = _as_c_int_ptr(mesh2d.face_edges, owners)
+        c_mesh2d.face_nodes = _as_c_int_ptr(mesh2d.face_nodes, owners)
+        c_mesh2d.nodes_per_face = _as_c_int_ptr(mesh2d.nodes_per_face, owners)
+        c_mesh2d.node_x = _as_c_double_ptr(mesh2d.node_x, owners)
+        c_mesh2d.node_y = _as_c_double_ptr(mesh2d.node_y, owners)
+        c_mesh2d.edge_x = _as_c_double_ptr(mesh2d.edge_x, owners)
+        c_mesh2d.edge_y = _as_c_double_ptr(mesh2d.edge_y, owners)
+        c_mesh2d.face_x = _as_c_double_ptr(mesh2d.face_x, owners)
+        c_mesh2d.face_y = _as_c_double_ptr(mesh2d.face_y, owners)
+        c_mesh2d._memory_owner = owners
 
         # Set the sizes
         c_mesh2d.num_nodes = mesh2d.node_x.size
@@ -136,19 +193,19 @@ class CMesh2d(Structure):
         edge_faces = np.empty(self.num_edges * 2, dtype=np.int32)
         face_edges = np.empty(self.num_face_nodes, dtype=np.int32)
 
-        self.edge_nodes = as_ctypes(edge_nodes)
-        self.face_nodes = as_ctypes(face_nodes)
-        self.nodes_per_face = as_ctypes(nodes_per_face)
-        self.node_x = as_ctypes(node_x)
-        self.node_y = as_ctypes(node_y)
-        self.edge_x = as_ctypes(edge_x)
-        self.edge_y = as_ctypes(edge_y)
-        self.face_x = as_ctypes(face_x)
-        self.face_y = as_ctypes(face_y)
-        self.edge_faces = as_ctypes(edge_faces)
-        self.face_edges = as_ctypes(face_edges)
-
-        return Mesh2d(
+        self.edge_nodes = edge_nodes.ctypes.data_as(POINTER(c_int))
+        self.face_nodes = face_nodes.ctypes.data_as(POINTER(c_int))
+        self.nodes_per_face = nodes_per_face.ctypes.data_as(POINTER(c_int))
+        self.node_x = node_x.ctypes.data_as(POINTER(c_double))
+        self.node_y = node_y.ctypes.data_as(POINTER(c_double))
+        self.edge_x = edge_x.ctypes.data_as(POINTER(c_double))
+        self.edge_y = edge_y.ctypes.data_as(POINTER(c_double))
+        self.face_x = face_x.ctypes.data_as(POINTER(c_double))
+        self.face_y = face_y.ctypes.data_as(POINTER(c_double))
+        self.edge_faces = edge_faces.ctypes.data_as(POINTER(c_int))
+        self.face_edges = face_edges.ctypes.data_as(POINTER(c_int))
+
+        mesh2d = Mesh2d(
             node_x=node_x,
             node_y=node_y,
             edge_nodes=edge_nodes,
@@ -162,6 +219,11 @@ class CMesh2d(Structure):
             face_edges=face_edges,
         )
 
+        # The pointers do not keep the arrays alive, so the structure holds on to their owner
+        self._memory_owner = mesh2d
+
+        return mesh2d
+
 
 class CGeometryList(Structure):
     """C-structure intended for internal use only.
@@ -204,19 +266,19 @@ class CGeometryList(Structure):
             )
 
         c_geometry_list = CGeometryList()
+        owners = []
 
         c_geometry_list.geometry_separator = geometry_list.geometry_separator
         c_geometry_list.inner_outer_separator = geometry_list.inner_outer_separator
         c_geometry_list.n_coordinates = geometry_list.x_coordinates.size
-        c_geometry_list.x_coordinates = as_ctypes(
-            to_contiguous_numpy_array(geometry_list.x_coordinates)
+        c_geometry_list.x_coordinates = _as_c_double_ptr(
+            geometry_list.x_coordinates, owners
         )
-        c_geometry_list.y_coordinates = as_ctypes(
-            to_contiguous_numpy_array(geometry_list.y_coordinates)
-        )
-        c_geometry_list.values = as_ctypes(
-            to_contiguous_numpy_array(geometry_list.values)
+        c_geometry_list.y_coordinates = _as_c_double_ptr(
+            geometry_list.y_coordinates, owners
         )
+        c_geometry_list.values = _as_c_double_ptr(geometry_list.values, owners)
+        c_geometry_list._memory_owner = owners
 
         return c_geometry_list
 
@@ -258,27 +320,9 @@ class COrthogonalizationParameters(Structure):
             COrthogonalizationParameters: The created C-Structure for the given OrthogonalizationParameters.
         """
 
-        c_orthogonalizationparameters = COrthogonalizationParameters()
-        c_orthogonalizationparameters.outer_iterations = (
-            orthogonalization_parameters.outer_iterations
-        )
-        c_orthogonalizationparameters.boundary_iterations = (
-            orthogonalization_parameters.boundary_iterations
-        )
-        c_orthogonalizationparameters.inner_iterations = (
-            orthogonalization_parameters.inner_iterations
-        )
-        c_orthogonalizationparameters.orthogonalization_to_smoothing_factor = (
-            orthogonalization_parameters.orthogonalization_to_smoothing_factor
+        return _parameters_from(
+            COrthogonalizationParameters, orthogonalization_parameters
         )
-        c_orthogonalizationparameters.orthogonalization_to_smoothing_factor_at_boundary = (
-            orthogonalization_parameters.orthogonalization_to_smoothing_factor_at_boundary
-        )
-        c_orthogonalizationparameters.areal_to_angle_smoothing_factor = (
-            orthogonalization_parameters.areal_to_angle_smoothing_factor
-        )
-
-        return c_orthogonalizationparameters
 
 
 class CMeshRefinementParameters(Structure):
@@ -323,32 +367,7 @@ class CMeshRefinementParameters(Structure):
             CMeshRefinementParameters: The created C-Structure for the given MeshRefinementParameters.
         """
 
-        c_parameters = CMeshRefinementParameters()
-        c_parameters.max_refinement_iterations = (
-            mesh_refinement_parameters.max_refinement_iterations
-        )
-        c_parameters.refine_intersected = mesh_refinement_parameters.refine_intersected
-        c_parameters.use_mass_center_when_refining = (
-            mesh_refinement_parameters.use_mass_center_when_refining
-        )
-        c_parameters.min_edge_size = mesh_refinement_parameters.min_edge_size
-        c_parameters.refinement_type = mesh_refinement_parameters.refinement_type
-        c_parameters.connect_hanging_nodes = (
-            mesh_refinement_parameters.connect_hanging_nodes
-        )
-        c_parameters.account_for_samples_outside_face = (
-            mesh_refinement_parameters.account_for_samples_outside_face
-        )
-
-        c_parameters.smoothing_iterations = (
-            mesh_refinement_parameters.smoothing_iterations
-        )
-        c_parameters.max_courant_time = mesh_refinement_parameters.max_courant_time
-        c_parameters.directional_refinement = (
-            mesh_refinement_parameters.directional_refinement
-        )
-
-        return c_parameters
+        return _parameters_from(CMeshRefinementParameters, mesh_refinement_parameters)
 
 
 class CMakeGridParameters(Structure):
@@ -394,17 +413,7 @@ class CMakeGridParameters(Structure):
             CMakeGridParameters: The created C-Structure for the given MakeGridParameters.
         """
 
-        c_parameters = CMakeGridParameters()
-        c_parameters.num_columns = make_grid_parameters.num_columns
-        c_parameters.num_rows = make_grid_parameters.num_rows
-        c_parameters.angle = make_grid_parameters.angle
-        c_parameters.origin_x = make_grid_parameters.origin_x
-        c_parameters.origin_y = make_grid_parameters.origin_y
-        c_parameters.block_size_x = make_grid_parameters.block_size_x
-        c_parameters.block_size_y = make_grid_parameters.block_size_y
-        c_parameters.upper_right_x = make_grid_parameters.upper_right_x
-        c_parameters.upper_right_y = make_grid_parameters.upper_right_y
-        return c_parameters
+        return _parameters_from(CMakeGridParameters, make_grid_parameters)
 
 
 class CMesh1d(Structure):
@@ -450,11 +459,13 @@ class CMesh1d(Structure):
             )
 
         c_mesh1d = CMesh1d()
+        owners = []
 
         # Set the pointers
-        c_mesh1d.edge_nodes = as_ctypes(mesh1d.edge_nodes)
-        c_mesh1d.node_x = as_ctypes(mesh1d.node_x)
-        c_mesh1d.node_y = as_ctypes(mesh1d.node_y)
+        c_mesh1d.edge_nodes = _as_c_int_ptr(mesh1d.edge_nodes, owners)
+        c_mesh1d.node_x = _as_c_double_ptr(mesh1d.node_x, owners)
+        c_mesh1d.node_y = _as_c_double_ptr(mesh1d.node_y, owners)
+        c_mesh1d._memory_owner = owners
 
         # Set the sizes
         c_mesh1d.num_nodes = mesh1d.node_x.size
@@ -475,11 +486,16 @@ class CMesh1d(Structure):
         node_x = np.empty(self.num_nodes, dtype=np.double)
         node_y = np.empty(self.num_nodes, dtype=np.double)
 
-        self.edge_nodes = as_ctypes(edge_nodes)
-        self.node_x = as_ctypes(node_x)
-        self.node_y = as_ctypes(node_y)
+        self.edge_nodes = edge_nodes.ctypes.data_as(POINTER(c_int))
+        self.node_x = node_x.ctypes.data_as(POINTER(c_double))
+        self.node_y = node_y.ctypes.data_as(POINTER(c_double))
+
+        mesh1d = Mesh1d(node_x=node_x, node_y=node_y, edge_nodes=edge_nodes)
 
-        return Mesh1d(node_x=node_x, node_y=node_y, edge_nodes=edge_nodes)
+        # The pointers do not keep the arrays alive, so the structure holds on to their owner
+        self._memory_owner = mesh1d
+
+        return mesh1d
 
 
 class CContacts(Structure):
@@ -517,9 +533,11 @@ class CContacts(Structure):
             )
 
         c_contacts = CContacts()
+        owners = []
 
-        c_contacts.mesh1d_indices = as_ctypes(contacts.mesh1d_indices)
-        c_contacts.mesh2d_indices = as_ctypes(contacts.mesh2d_indices)
+        c_contacts.mesh1d_indices = _as_c_int_ptr(contacts.mesh1d_indices, owners)
+        c_contacts.mesh2d_indices = _as_c_int_ptr(contacts.mesh2d_indices, owners)
+        c_contacts._memory_owner = owners
         c_contacts.num_contacts = contacts.mesh1d_indices.size
 
         return c_contacts
@@ -536,10 +554,15 @@ class CContacts(Structure):
         mesh1d_indices = np.empty(self.num_contacts, dtype=np.int32)
         mesh2d_indices = np.empty(self.num_contacts, dtype=np.int32)
 
-        self.mesh1d_indices = as_ctypes(mesh1d_indices)
-        self.mesh2d_indices = as_ctypes(mesh2d_indices)
+        self.mesh1d_indices = mesh1d_indices.ctypes.data_as(POINTER(c_int))
+        self.mesh2d_indices = mesh2d_indices.ctypes.data_as(POINTER(c_int))
+
+        contacts = Contacts(mesh1d_indices, mesh2d_indices)
 
-        return Contacts(mesh1d_indices, mesh2d_indices)
+        # The pointers do not keep the arrays alive, so the structure holds on to their owner
+        self._memory_owner = contacts
+
+        return contacts
 
 
 class CCurvilinearGrid(Structure):
@@ -579,10 +602,12 @@ class CCurvilinearGrid(Structure):
             )
 
         c_curvilinear_grid = CCurvilinearGrid()
+        owners = []
 
         # Set the pointers
-        c_curvilinear_grid.node_x = as_ctypes(curvilinear_grid.node_x)
-        c_curvilinear_grid.node_y = as_ctypes(curvilinear_grid.node_y)
+        c_curvilinear_grid.node_x = _as_c_double_ptr(curvilinear_grid.node_x, owners)
+        c_curvilinear_grid.node_y = _as_c_double_ptr(curvilinear_grid.node_y, owners)
+        c_curvilinear_grid._memory_owner = owners
 
         # Set the sizes
         c_curvilinear_grid.num_m = curvilinear_grid.num_m
@@ -602,10 +627,15 @@ class CCurvilinearGrid(Structure):
         node_x = np.empty(self.num_m * self.num_n, dtype=np.double)
         node_y = np.empty(self.num_m * self.num_n, dtype=np.double)
 
-        self.node_x = as_ctypes(node_x)
-        self.node_y = as_ctypes(node_y)
+        self.node_x = node_x.ctypes.data_as(POINTER(c_double))
+        self.node_y = node_y.ctypes.data_as(POINTER(c_double))
+
+        curvilinear_grid = CurvilinearGrid(node_x, node_y, self.num_m, self.num_n)
+
+        # The pointers do not keep the arrays alive, so the structure holds on to their owner
+        self._memory_owner = curvilinear_grid
 
-        return CurvilinearGrid(node_x, node_y, self.num_m, self.num_n)
+        return curvilinear_grid
 
 
 class CCurvilinearParameters(Structure):
@@ -643,20 +673,7 @@ class CCurvilinearParameters(Structure):
             CCurvilinearParameters: The created C-Structure for the given CurvilinearParameters.
         """
 
-        c_curvilinear_parameters = CCurvilinearParameters()
-        c_curvilinear_parameters.m_refinement = curvilinear_parameters.m_refinement
-        c_curvilinear_parameters.n_refinement = curvilinear_parameters.n_refinement
-        c_curvilinear_parameters.smoothing_iterations = (
-            curvilinear_parameters.smoothing_iterations
-        )
-        c_curvilinear_parameters.smoothing_parameter = (
-            curvilinear_parameters.smoothing_parameter
-        )
-        c_curvilinear_parameters.attraction_parameter = (
-            curvilinear_parameters.attraction_parameter
-        )
-
-        return c_curvilinear_parameters
+        return _parameters_from(CCurvilinearParameters, curvilinear_parameters)
 
 
 class CSplinesToCurvilinearParameters(Structure):
@@ -704,39 +721,9 @@ class CSplinesToCurvilinearParameters(Structure):
             COrthogonalizationParameters: The created C-Structure for the given OrthogonalizationParameters.
         """
 
-        c_splines_to_curvilinear_parameters = CSplinesToCurvilinearParameters()
-        c_splines_to_curvilinear_parameters.aspect_ratio = (
-            splines_to_curvilinear_parameters.aspect_ratio
-        )
-        c_splines_to_curvilinear_parameters.aspect_ratio_grow_factor = (
-            splines_to_curvilinear_parameters.aspect_ratio_grow_factor
-        )
-        c_splines_to_curvilinear_parameters.average_width = (
-            splines_to_curvilinear_parameters.average_width
-        )
-        c_splines_to_curvilinear_parameters.curvature_adapted_grid_spacing = (
-            splines_to_curvilinear_parameters.curvature_adapted_grid_spacing
+        return _parameters_from(
+            CSplinesToCurvilinearParameters, splines_to_curvilinear_parameters
         )
-        c_splines_to_curvilinear_parameters.grow_grid_outside = (
-            splines_to_curvilinear_parameters.grow_grid_outside
-        )
-        c_splines_to_curvilinear_parameters.maximum_num_faces_in_uniform_part = (
-            splines_to_curvilinear_parameters.maximum_num_faces_in_uniform_part
-        )
-        c_splines_to_curvilinear_parameters.nodes_on_top_of_each_other_tolerance = (
-            splines_to_curvilinear_parameters.nodes_on_top_of_each_other_tolerance
-        )
-        c_splines_to_curvilinear_parameters.min_cosine_crossing_angles = (
-            splines_to_curvilinear_parameters.min_cosine_crossing_angles
-        )
-        c_splines_to_curvilinear_parameters.check_front_collisions = (
-            splines_to_curvilinear_parameters.check_front_collisions
-        )
-        c_splines_to_curvilinear_parameters.remove_skinny_triangles = (
-            splines_to_curvilinear_parameters.remove_skinny_triangles
-        )
-
-        return c_splines_to_curvilinear_parameters
 
 
 class CGriddedSamples(Structure):
@@ -782,14 +769,15 @@ class CGriddedSamples(Structure):
         """
 
         c_gridded_samples = CGriddedSamples()
+        owners = []
 
         if len(gridded_samples.x_coordinates) == 0:
             num_x = gridded_samples.num_x
             c_gridded_samples.x_coordinates = None
         else:
             num_x = len(gridded_samples.x_coordinates)
-            c_gridded_samples.x_coordinates = as_ctypes(
-                to_contiguous_numpy_array(gridded_samples.x_coordinates)
+            c_gridded_samples.x_coordinates = _as_c_double_ptr(
+                gridded_samples.x_coordinates, owners
             )
 
         if len(gridded_samples.y_coordinates) == 0:
@@ -797,8 +785,8 @@ class CGriddedSamples(Structure):
             c_gridded_samples.y_coordinates = None
         else:
             num_y = len(gridded_samples.y_coordinates)
-            c_gridded_samples.y_coordinates = as_ctypes(
-                to_contiguous_numpy_array(gridded_samples.y_coordinates)
+            c_gridded_samples.y_coordinates = _as_c_double_ptr(
+                gridded_samples.y_coordinates, owners
             )
 
         c_gridded_samples.num_x = num_x
@@ -806,9 +794,11 @@ class CGriddedSamples(Structure):
         c_gridded_samples.x_origin = gridded_samples.x_origin
         c_gridded_samples.y_origin = gridded_samples.y_origin
         c_gridded_samples.cell_size = gridded_samples.cell_size
-        c_gridded_samples.values = to_contiguous_numpy_array(
-            gridded_samples.values
-        ).ctypes.data_as(c_void_p)
+        # The values keep their dtype, which is described by the value type
+        values = to_contiguous_numpy_array(gridded_samples.values)
+        owners.append(values)
+        c_gridded_samples.values = values.ctypes.data_as(c_void_p)
         c_gridded_samples.value_type = gridded_samples.value_type
+        c_gridded_samples._memory_owner = owners
 
         return c_gridded_samples
@@ -1,8 +1,11 @@
+import codecs
 import logging
 import os
 import platform
+import weakref
 from ctypes import (
     CDLL,
+    POINTER,
     byref,
     c_char_p,
     c_double,
@@ -11,12 +14,12 @@ from ctypes import (
     create_string_buffer,
 )
 from enum import IntEnum
+from functools import lru_cache
 from pathlib import Path
 from typing import Tuple
 
 import numpy as np
 from numpy import ndarray
-from numpy.ctypeslib import as_ctypes
 
 from meshkernel.c_structures import (
     CContacts,
@@ -59,9 +62,425 @@ from meshkernel.version import __version__
 
 logger = logging.getLogger(__name__)
 
+_ascii_decode = codecs.getdecoder("ascii")
+
+# Bounding box covering every representable coordinate, used by the single point queries
+_MAXIMUM_BOUNDING_BOX = get_maximum_bounding_box_coordinates()
+
+# Categories of the MeshKernelError raised for each failing exit code of the backend
+_ERROR_CATEGORIES = {
+    "MESHKERNEL_ERROR": "MeshKernelError",
+    "NOT_IMPLEMENTED_ERROR": "NotImplementedError",
+    "ALGORITHM_ERROR": "AlgorithmError",
+    "CONSTRAINT_ERROR": "ConstraintError",
+    "LINEAR_ALGEBRA_ERROR": "LinearAlgebraError",
+    "RANGE_ERROR": "RangeError",
+    "STDLIB_EXCEPTION": "STDLibException",
+    "UNKNOWN_EXCEPTION": "UnknownException",
+}
+
+# Array arguments, checked by ctypes for their type, dimension and memory layout before being passed as a pointer
+_INT32_ARRAY = np.ctypeslib.ndpointer(dtype=np.int32, ndim=1, flags="C_CONTIGUOUS")
+_DOUBLE_ARRAY = np.ctypeslib.ndpointer(dtype=np.double, ndim=1, flags="C_CONTIGUOUS")
+
+# Argument and return types of the MeshKernel API functions.
+# Declaring them once lets ctypes convert the arguments directly instead of guessing their types on every call.
+_FUNCTION_SIGNATURES = {
+    "mkernel_allocate_state": ([c_int, POINTER(c_int)], c_int),
+    "mkernel_deallocate_state": ([c_int], c_int),
+    "mkernel_set_undo_size": ([c_int], c_int),
+    "mkernel_get_projection": ([c_int, POINTER(c_int)], c_int),
+    "mkernel_get_splines": (
+        [POINTER(CGeometryList), POINTER(CGeometryList), c_int],
+        c_int,
+    ),
+    "mkernel_mesh2d_set": ([c_int, POINTER(CMesh2d)], c_int),
+    "mkernel_mesh2d_add": ([c_int, POINTER(CMesh2d)], c_int),
+    "mkernel_mesh2d_get_data": ([c_int, POINTER(CMesh2d)], c_int),
+    "mkernel_mesh2d_get_dimensions": ([c_int, POINTER(CMesh2d)], c_int),
+    "mkernel_mesh2d_delete": ([c_int, POINTER(CGeometryList), c_int, c_int], c_int),
+    "mkernel_mesh2d_insert_edge": ([c_int, c_int, c_int, POINTER(c_int)], c_int),
+    "mkernel_mesh2d_insert_node": ([c_int, c_double, c_double, POINTER(c_int)], c_int),
+    "mkernel_mesh2d_delete_node": ([c_int, c_int], c_int),
+    "mkernel_mesh2d_move_node": ([c_int, c_double, c_double, c_int], c_int),
+    "mkernel_mesh2d_delete_edge": ([c_int] + [c_double] * 6, c_int),
+    "mkernel_mesh2d_get_edge": ([c_int] + [c_double] * 6 + [POINTER(c_int)], c_int),
+    "mkernel_mesh2d_get_face_polygons_dimension": (
+        [c_int, c_int, POINTER(c_int)],
+        c_int,
+    ),
+    "mkernel_mesh2d_get_face_polygons": ([c_int, c_int, POINTER(CGeometryList)], c_int),
+    "mkernel_mesh2d_get_filtered_face_polygons_dimension": (
+        [c_int, c_int, c_double, c_double, POINTER(c_int)],
+        c_int,
+    ),
+    "mkernel_mesh2d_get_filtered_face_polygons": (
+        [c_int, c_int, c_double, c_double, POINTER(CGeometryList)],
+        c_int,
+    ),
+    "mkernel_mesh2d_get_node_index": (
+        [c_int] + [c_double] * 7 + [POINTER(c_int)],
+        c_int,
+    ),
+    "mkernel_mesh2d_count_hanging_edges": ([c_int, POINTER(c_int)], c_int),
+    "mkernel_mesh2d_get_hanging_edges": ([c_int, _INT32_ARRAY], c_int),
+    "mkernel_mesh2d_delete_hanging_edges": ([c_int], c_int),
+    "mkernel_mesh2d_make_global": ([c_int, c_int, c_int], c_int),
+    "mkernel_mesh2d_make_triangular_mesh_from_polygon": (
+        [c_int, POINTER(CGeometryList)],
+        c_int,
+    ),
+    "mkernel_mesh2d_make_triangular_mesh_from_samples": (
+        [c_int, POINTER(CGeometryList)],
+        c_int,
+    ),
+    "mkernel_mesh2d_make_rectangular_mesh": (
+        [c_int, POINTER(CMakeGridParameters)],
+        c_int,
+    ),
+    "mkernel_mesh2d_make_rectangular_mesh_from_polygon": (
+        [c_int, POINTER(CMakeGridParameters), POINTER(CGeometryList)],
+        c_int,
+    ),
+    "mkernel_mesh2d_make_rectangular_mesh_on_extension": (
+        [c_int, POINTER(CMakeGridParameters)],
+        c_int,
+    ),
+    "mkernel_polygon_count_refine": (
+        [c_int, POINTER(CGeometryList), c_int, c_int, c_double, POINTER(c_int)],
+        c_int,
+    ),
+    "mkernel_polygon_refine": (
+        [
+            c_int,
+            POINTER(CGeometryList),
+            c_int,
+            c_int,
+            c_double,
+            POINTER(CGeometryList),
+        ],
+        c_int,
+    ),
+    "mkernel_polygon_get_included_points": (
+        [
+            c_int,
+            POINTER(CGeometryList),
+            POINTER(CGeometryList),
+            POINTER(CGeometryList),
+        ],
+        c_int,
+    ),
+    "mkernel_mesh2d_refine_based_on_samples": (
+        [
+            c_int,
+            POINTER(CGeometryList),
+            c_double,
+            c_int,
+            POINTER(CMeshRefinementParameters),
+        ],
+        c_int,
+    ),
+    "mkernel_mesh2d_refine_ridges_based_on_gridded_samples": (
+        [
+            c_int,
+            POINTER(CGriddedSamples),
+            c_double,
+            c_int,
+            c_int,
+            POINTER(CMeshRefinementParameters),
+        ],
+        c_int,
+    ),
+    "mkernel_mesh2d_refine_based_on_gridded_samples": (
+        [
+            c_int,
+            POINTER(CGriddedSamples),
+            POINTER(CMeshRefinementParameters),
+            c_int,
+        ],
+        c_int,
+    ),
+    "mkernel_mesh2d_refine_based_on_polygon": (
+        [c_int, POINTER(CGeometryList), POINTER(CMeshRefinementParameters)],
+        c_int,
+    ),
+    "mkernel_mesh2d_remove_disconnected_regions": ([c_int], c_int),
+    "mkernel_mesh2d_rotate": ([c_int, c_double, c_double, c_double], c_int),
+    "mkernel_mesh2d_translate": ([c_int, c_double, c_double], c_int),
+    "mkernel_mesh2d_flip_edges": (
+        [c_int, c_int, c_int, POINTER(CGeometryList), POINTER(CGeometryList)],
+        c_int,
+    ),
+    "mkernel_mesh2d_count_obtuse_triangles": ([c_int, POINTER(c_int)], c_int),
+    "mkernel_mesh2d_get_obtuse_triangles_mass_centers": (
+        [c_int, POINTER(CGeometryList)],
+        c_int,
+    ),
+    "mkernel_mesh2d_count_small_flow_edge_centers": (
+        [c_int, c_double, POINTER(c_int)],
+        c_int,
+    ),
+    "mkernel_mesh2d_get_small_flow_edge_centers": (
+        [c_int, c_double, POINTER(CGeometryList)],
+        c_int,
+    ),
+    "mkernel_mesh2d_delete_small_flow_edges_and_small_triangles": (
+        [c_int, c_double, c_double],
+        c_int,
+    ),
+    "mkernel_mesh2d_count_mesh_boundaries_as_polygons": (
+        [c_int, POINTER(c_int)],
+        c_int,
+    ),
+    "mkernel_mesh2d_get_mesh_boundaries_as_polygons": (
+        [c_int, POINTER(CGeometryList)],
+        c_int,
+    ),
+    "mkernel_mesh2d_merge_nodes": ([c_int, POINTER(CGeometryList)], c_int),
+    "mkernel_mesh2d_merge_nodes_with_merging_distance": (
+        [c_int, POINTER(CGeometryList), c_double],
+        c_int,
+    ),
+    "mkernel_mesh2d_merge_two_nodes": ([c_int, c_int, c_int], c_int),
+    "mkernel_mesh2d_count_nodes_in_polygons": (
+        [c_int, POINTER(CGeometryList), c_int, POINTER(c_int)],
+        c_int,
+    ),
+    "mkernel_mesh2d_get_nodes_in_polygons": (
+        [c_int, POINTER(CGeometryList), c_int, _INT32_ARRAY],
+        c_int,
+    ),
+    "mkernel_mesh2d_casulli_derefinement": ([c_int], c_int),
+    "mkernel_mesh2d_casulli_derefinement_on_polygon": (
+        [c_int, POINTER(CGeometryList)],
+        c_int,
+    ),
+    "mkernel_mesh2d_casulli_refinement": ([c_int], c_int),
+    "mkernel_mesh2d_casulli_refinement_on_polygon": (
+        [c_int, POINTER(CGeometryList)],
+        c_int,
+    ),
+    "mkernel_mesh2d_compute_orthogonalization": (
+        [
+            c_int,
+            c_int,
+            POINTER(COrthogonalizationParameters),
+            POINTER(CGeometryList),
+            POINTER(CGeometryList),
+        ],
+        c_int,
+    ),
+    "mkernel_mesh2d_get_orthogonality": ([c_int, POINTER(CGeometryList)], c_int),
+    "mkernel_mesh2d_get_property_dimension": (
+        [c_int, c_int, POINTER(c_int)],
+        c_int,
+    ),
+    "mkernel_mesh2d_get_property": (
+        [c_int, c_int, c_int, POINTER(CGeometryList)],
+        c_int,
+    ),
+    "mkernel_mesh2d_get_smoothness": ([c_int, POINTER(CGeometryList)], c_int),
+    "mkernel_mesh2d_connect_meshes": ([c_int, POINTER(CMesh2d), c_double], c_int),
+    "mkernel_mesh2d_triangulation_interpolation": (
+        [c_int, POINTER(CGeometryList), c_int, POINTER(CGeometryList)],
+        c_int,
+    ),
+    "mkernel_mesh2d_averaging_interpolation": (
+        [
+            c_int,
+            POINTER(CGeometryList),
+            c_int,
+            c_int,
+            c_double,
+            c_size_t,
+            POINTER(CGeometryList),
+        ],
+        c_int,
+    ),
+    "mkernel_mesh2d_convert_projection": ([c_int, c_int, c_char_p], c_int),
+    "mkernel_mesh1d_set": ([c_int, POINTER(CMesh1d)], c_int),
+    "mkernel_mesh1d_add": ([c_int, POINTER(CMesh1d)], c_int),
+    "mkernel_mesh1d_get_data": ([c_int, POINTER(CMesh1d)], c_int),
+    "mkernel_mesh1d_get_dimensions": ([c_int, POINTER(CMesh1d)], c_int),
+    "mkernel_contacts_set": ([c_int, POINTER(CContacts)], c_int),
+    "mkernel_contacts_get_data": ([c_int, POINTER(CContacts)], c_int),
+    "mkernel_contacts_get_dimensions": ([c_int, POINTER(CContacts)], c_int),
+    "mkernel_contacts_compute_single": (
+        [c_int, _INT32_ARRAY, POINTER(CGeometryList), c_double],
+        c_int,
+    ),
+    "mkernel_contacts_compute_multiple": ([c_int, _INT32_ARRAY], c_int),
+    "mkernel_contacts_compute_with_polygons": (
+        [c_int, _INT32_ARRAY, POINTER(CGeometryList)],
+        c_int,
+    ),
+    "mkernel_contacts_compute_with_points": (
+        [c_int, _INT32_ARRAY, POINTER(CGeometryList)],
+        c_int,
+    ),
+    "mkernel_contacts_compute_boundary": (
+        [c_int, _INT32_ARRAY, POINTER(CGeometryList), c_double],
+        c_int,
+    ),
+    "mkernel_curvilinear_get_dimensions": (
+        [c_int, POINTER(CCurvilinearGrid)],
+        c_int,
+    ),
+    "mkernel_curvilinear_get_data": ([c_int, POINTER(CCurvilinearGrid)], c_int),
+    "mkernel_curvilinear_compute_transfinite_from_splines": (
+        [c_int, POINTER(CGeometryList), POINTER(CCurvilinearParameters)],
+        c_int,
+    ),
+    "mkernel_curvilinear_compute_orthogonal_grid_from_splines": (
+        [
+            c_int,
+            POINTER(CGeometryList),
+            POINTER(CCurvilinearParameters),
+            POINTER(CSplinesToCurvilinearParameters),
+        ],
+        c_int,
+    ),
+    "mkernel_curvilinear_compute_curvature": (
+        [c_int, c_int, _DOUBLE_ARRAY],
+        c_int,
+    ),
+    "mkernel_curvilinear_compute_smoothness": (
+        [c_int, c_int, _DOUBLE_ARRAY],
+        c_int,
+    ),
+    "mkernel_curvilinear_convert_to_mesh2d": ([c_int], c_int),
+    "mkernel_curvilinear_compute_rectangular_grid": (
+        [c_int, POINTER(CMakeGridParameters)],
+        c_int,
+    ),
+    "mkernel_curvilinear_compute_rectangular_grid_from_polygon": (
+        [c_int, POINTER(CMakeGridParameters), POINTER(CGeometryList)],
+        c_int,
+    ),
+    "mkernel_curvilinear_compute_rectangular_grid_on_extension": (
+        [c_int, POINTER(CMakeGridParameters)],
+        c_int,
+    ),
+    "mkernel_curvilinear_refine": ([c_int] + [c_double] * 4 + [c_int], c_int),
+    "mkernel_curvilinear_derefine": ([c_int] + [c_double] * 4, c_int),
+    "mkernel_curvilinear_compute_transfinite_from_polygon": (
+        [c_int, POINTER(CGeometryList), c_int, c_int, c_int, c_int],
+        c_int,
+    ),
+    "mkernel_curvilinear_initialize_orthogonalize": (
+        [c_int, POINTER(COrthogonalizationParameters)],
+        c_int,
+    ),
+    "mkernel_curvilinear_set_block_orthogonalize": ([c_int] + [c_double] * 4, c_int),
+    "mkernel_curvilinear_set_frozen_lines_orthogonalize": (
+        [c_int] + [c_double] * 4,
+        c_int,
+    ),
+    "mkernel_curvilinear_orthogonalize": ([c_int], c_int),
+    "mkernel_curvilinear_finalize_orthogonalize": ([c_int], c_int),
+    "mkernel_curvilinear_smoothing": ([c_int, c_int] + [c_double] * 4, c_int),
+    "mkernel_curvilinear_smoothing_directional": (
+        [c_int, c_int] + [c_double] * 8,
+        c_int,
+    ),
+    "mkernel_curvilinear_initialize_line_shift": ([c_int], c_int),
+    "mkernel_curvilinear_set_line_line_shift": ([c_int] + [c_double] * 4, c_int),
+    "mkernel_curvilinear_set_block_line_shift": ([c_int] + [c_double] * 4, c_int),
+    "mkernel_curvilinear_move_node_line_shift": ([c_int] + [c_double] * 4, c_int),
+    "mkernel_curvilinear_line_shift": ([c_int], c_int),
+    "mkernel_curvilinear_finalize_line_shift": ([c_int], c_int),
+    "mkernel_curvilinear_move_node": ([c_int] + [c_double] * 4, c_int),
+    "mkernel_curvilinear_insert_face": ([c_int, c_double, c_double], c_int),
+    "mkernel_curvilinear_line_attraction_repulsion": (
+        [c_int] + [c_double] * 9,
+        c_int,
+    ),
+    "mkernel_curvilinear_line_mirror": ([c_int] + [c_double] * 5, c_int),
+    "mkernel_curvilinear_delete_node": ([c_int, c_double, c_double], c_int),
+    "mkernel_get_exit_code_success": ([POINTER(c_int)], c_int),
+    "mkernel_get_exit_code_meshkernel_error": ([POINTER(c_int)], c_int),
+    "mkernel_get_exit_code_not_implemented_error": ([POINTER(c_int)], c_int),
+    "mkernel_get_exit_code_algorithm_error": ([POINTER(c_int)], c_int),
+    "mkernel_get_exit_code_constraint_error": ([POINTER(c_int)], c_int),
+    "mkernel_get_exit_code_mesh_geometry_error": ([POINTER(c_int)], c_int),
+    "mkernel_get_exit_code_linear_algebra_error": ([POINTER(c_int)], c_int),
+    "mkernel_get_exit_code_range_error": ([POINTER(c_int)], c_int),
+    "mkernel_get_exit_code_stdlib_exception": ([POINTER(c_int)], c_int),
+    "mkernel_get_exit_code_unknown_exception": ([POINTER(c_int)], c_int),
+    "mkernel_get_error": ([c_char_p], c_int),
+    "mkernel_get_geometry_error": ([POINTER(c_int), POINTER(c_int)], c_int),
+    "mkernel_get_version": ([c_char_p], c_int),
+    "mkernel_get_separator": ([], c_double),
+    "mkernel_get_inner_outer_separator": ([], c_double),
+}
+
+
+def _get_library_path() -> str:
+    """Gets the path of the MeshKernel library shipped for the current operating system.
+
+    Raises:
+        OSError: This gets raised in case MeshKernel is used within an unsupported OS.
+
+    Returns:
+        str: The path of the MeshKernel library.
+    """
+
+    # Determine OS
+    system = platform.system()
+
+    file_path = Path(__file__).parent
+    if system == "Windows":
+        return os.path.join(file_path, "MeshKernelApi.dll")
+    if system == "Linux":
+        return os.path.join(file_path, "libMeshKernelApi.so")
+    if system == "Darwin":
+        return os.path.join(file_path, "libMeshKernelApi.dylib")
+    if not system:
+        system = "Unknown OS"
+    raise OSError("Unsupported operating system: {}".format(system))
+
+
+@lru_cache(maxsize=1)
+def _load_library() -> CDLL:
+    """Loads the MeshKernel library and declares the signatures of its functions.
+
+    The library is only resolved and loaded once per process,
+    later calls return the already loaded library.
+
+    Raises:
+        OSError: This gets raised in case MeshKernel is used within an unsupported OS.
+
+    Returns:
+        CDLL: The loaded library.
+    """
+    lib = CDLL(_get_library_path())
+    for name, (argtypes, restype) in _FUNCTION_SIGNATURES.items():
+        function = getattr(lib, name)
+        function.argtypes = argtypes
+        function.restype = restype
+    return lib
+
+
+def _deallocate_state(deallocate_function, meshkernelid: int) -> None:
+    """Deallocates the state of a MeshKernel instance.
+
+    This function is registered as the finalizer of each MeshKernel instance
+    and should never be called manually.
+
+    Args:
+        deallocate_function: The `mkernel_deallocate_state` function of the library.
+        meshkernelid (int): The id of the state to deallocate.
+    """
+
+    deallocate_function(meshkernelid)
+
 
 class MeshKernel:
-    """This class is the entry point for interacting with the MeshKernel library"""
+    """This class is the entry point for interacting with the MeshKernel library
+
+    The arguments are converted to the declared argument types of the library functions.
+    An argument of the wrong type, such as a float passed as an index, raises a `ctypes.ArgumentError`.
+    """
 
     def __init__(self, projection: ProjectionType = ProjectionType.CARTESIAN):
         """Constructor of MeshKernel
@@ -73,24 +492,20 @@ class MeshKernel:
             OSError: This gets raised in case MeshKernel is used within an unsupported OS.
         """
 
-        # Determine OS
-        system = platform.system()
+        self.lib = _load_library()
 
-        file_path = Path(__file__).parent
-        if system == "Windows":
-            lib_path = os.path.join(file_path, "MeshKernelApi.dll")
-        elif system == "Linux":
-            lib_path = os.path.join(file_path, "libMeshKernelApi.so")
-        elif system == "Darwin":
-            lib_path = os.path.join(file_path, "libMeshKernelApi.dylib")
-        else:
-            if not system:
-                system = "Unknown OS"
-            raise OSError("Unsupported operating system: {}".format(system))
-
-        self.lib = CDLL(str(lib_path))
+        # Reused output argument of the functions returning a single integer,
+        # passed by the reference created once here
+        self._scratch_int = c_int()
+        self._scratch_int_ref = byref(self._scratch_int)
 
         self._exit_code = self.__get_exit_codes()
+        # Plain int, so checking the result of each call is a direct int comparison
+        self._success_exit_code = int(self._exit_code.SUCCESS)
+        self._error_categories = {
+            self._exit_code[name]: category
+            for name, category in _ERROR_CATEGORIES.items()
+        }
 
         self._allocate_state(projection)
 
@@ -102,9 +517,6 @@ class MeshKernel:
 
         self._set_undo_size(0)
 
-    def __del__(self):
-        self._deallocate_state()
-
     def __get_exit_codes(self):
         """Stores the backend exit codes
         Returns:
@@ -163,11 +575,22 @@ class MeshKernel:
             projection (ProjectionType): The projection type.
         """
 
-        self._meshkernelid = c_int()
+        meshkernelid = c_int()
         self._execute_function(
             self.lib.mkernel_allocate_state,
             projection,
-            byref(self._meshkernelid),
+            byref(meshkernelid),
+        )
+        # Kept as a plain int, which ctypes converts to the declared c_int argument directly
+        self._meshkernelid = meshkernelid.value
+
+        # The finalizer holds no reference to self, so it neither keeps the instance alive
+        # nor depends on its attributes when it runs at garbage collection or interpreter exit
+        self._finalizer = weakref.finalize(
+            self,
+            _deallocate_state,
+            self.lib.mkernel_deallocate_state,
+            self._meshkernelid,
         )
 
     def _set_undo_size(self, undo_stack_size: int) -> None:
@@ -178,19 +601,6 @@ class MeshKernel:
         """
         self._execute_function(self.lib.mkernel_set_undo_size, undo_stack_size)
 
-    def _deallocate_state(self) -> None:
-        """
-        Deallocate mesh state.
-
-        This method is called by the destructor and
-        should never be called manually
-        """
-
-        self._execute_function(
-            self.lib.mkernel_deallocate_state,
-            self._meshkernelid,
-        )
-
     def mesh2d_set(self, mesh2d: Mesh2d) -> None:
         """Sets the two-dimensional mesh state of the MeshKernel.
 
@@ -274,8 +684,8 @@ class MeshKernel:
             self.lib.mkernel_mesh2d_delete,
             self._meshkernelid,
             byref(c_geometry_list),
-            c_int(delete_option),
-            c_int(invert_deletion),
+            delete_option,
+            invert_deletion,
         )
 
     def mesh2d_insert_edge(self, start_node: int, end_node: int) -> int:
@@ -289,16 +699,15 @@ class MeshKernel:
             int: The index of the new edge.
         """
 
-        edge_index = c_int()
         self._execute_function(
             self.lib.mkernel_mesh2d_insert_edge,
             self._meshkernelid,
-            c_int(start_node),
-            c_int(end_node),
-            byref(edge_index),
+            start_node,
+            end_node,
+            self._scratch_int_ref,
         )
 
-        return edge_index.value
+        return self._scratch_int.value
 
     def mesh2d_insert_node(self, x: float, y: float) -> int:
         """Insert a new node at the specified coordinates
@@ -311,16 +720,14 @@ class MeshKernel:
             int: The index of the new node.
         """
 
-        index = c_int()
-
         self._execute_function(
             self.lib.mkernel_mesh2d_insert_node,
             self._meshkernelid,
-            c_double(x),
-            c_double(y),
-            byref(index),
+            x,
+            y,
+            self._scratch_int_ref,
         )
-        return index.value
+        return self._scratch_int.value
 
     def mesh2d_delete_node(self, node_index: int) -> None:
         """Deletes a Mesh2d node with the given `index`.
@@ -336,7 +743,7 @@ class MeshKernel:
             raise InputError("node_index needs to be a positive integer")
 
         self._execute_function(
-            self.lib.mkernel_mesh2d_delete_node, self._meshkernelid, c_int(node_index)
+            self.lib.mkernel_mesh2d_delete_node, self._meshkernelid, node_index
         )
 
     def mesh2d_move_node(self, x: float, y: float, node_index: int) -> None:
@@ -357,9 +764,9 @@ class MeshKernel:
         self._execute_function(
             self.lib.mkernel_mesh2d_move_node,
             self._meshkernelid,
-            c_double(x),
-            c_double(y),
-            c_int(node_index),
+            x,
+            y,
+            node_index,
         )
 
     def mesh2d_delete_edge(self, x_coordinate: float, y_coordinate: float) -> None:
@@ -376,17 +783,17 @@ class MeshKernel:
             y_lower_left,
             x_upper_right,
             y_upper_right,
-        ) = get_maximum_bounding_box_coordinates()
+        ) = _MAXIMUM_BOUNDING_BOX
 
         self._execute_function(
             self.lib.mkernel_mesh2d_delete_edge,
             self._meshkernelid,
-            c_double(x_coordinate),
-            c_double(y_coordinate),
-            c_double(x_lower_left),
-            c_double(y_lower_left),
-            c_double(x_upper_right),
-            c_double(y_upper_right),
+            x_coordinate,
+            y_coordinate,
+            x_lower_left,
+            y_lower_left,
+            x_upper_right,
+            y_upper_right,
         )
 
     def mesh2d_get_edge(self, x: float, y: float) -> int:
@@ -400,28 +807,26 @@ class MeshKernel:
             int: The index of the edge (gap-free array index)
         """
 
-        index = c_int()
-
         (
             x_lower_left,
             y_lower_left,
             x_upper_right,
             y_upper_right,
-        ) = get_maximum_bounding_box_coordinates()
+        ) = _MAXIMUM_BOUNDING_BOX
 
         self._execute_function(
             self.lib.mkernel_mesh2d_get_edge,
             self._meshkernelid,
-            c_double(x),
-            c_double(y),
-            c_double(x_lower_left),
-            c_double(y_lower_left),
-            c_double(x_upper_right),
-            c_double(y_upper_right),
-            byref(index),
+            x,
+            y,
+            x_lower_left,
+            y_lower_left,
+            x_upper_right,
+            y_upper_right,
+            self._scratch_int_ref,
         )
 
-        return index.value
+        return self._scratch_int.value
 
     def mesh2d_get_face_polygons(self, num_edges: int) -> GeometryList:
         """Gets the faces polygons with a number of edges equal to num_edges.
@@ -432,16 +837,14 @@ class MeshKernel:
         Returns:
             GeometryList: The resulting face polygons
         """
-        c_geometry_list_dimension = c_int()
-
         self._execute_function(
             self.lib.mkernel_mesh2d_get_face_polygons_dimension,
             self._meshkernelid,
-            c_int(num_edges),
-            byref(c_geometry_list_dimension),
+            num_edges,
+            self._scratch_int_ref,
         )
 
-        n_coordinates = c_geometry_list_dimension.value
+        n_coordinates = self._scratch_int.value
         x_coordinates = np.empty(n_coordinates, dtype=np.double)
         y_coordinates = np.empty(n_coordinates, dtype=np.double)
 
@@ -453,7 +856,7 @@ class MeshKernel:
         self._execute_function(
             self.lib.mkernel_mesh2d_get_face_polygons,
             self._meshkernelid,
-            c_int(num_edges),
+            num_edges,
             byref(c_face_polygons),
         )
 
@@ -473,18 +876,16 @@ class MeshKernel:
         Returns:
             GeometryList: The resulting face polygons
         """
-        c_geometry_list_dimension = c_int()
-
         self._execute_function(
             self.lib.mkernel_mesh2d_get_filtered_face_polygons_dimension,
             self._meshkernelid,
-            c_int(property),
-            c_double(min_value),
-            c_double(max_value),
-            byref(c_geometry_list_dimension),
+            property,
+            min_value,
+            max_value,
+            self._scratch_int_ref,
         )
 
-        n_coordinates = c_geometry_list_dimension.value
+        n_coordinates = self._scratch_int.value
         x_coordinates = np.empty(n_coordinates, dtype=np.double)
         y_coordinates = np.empty(n_coordinates, dtype=np.double)
 
@@ -496,9 +897,9 @@ class MeshKernel:
         self._execute_function(
             self.lib.mkernel_mesh2d_get_filtered_face_polygons,
             self._meshkernelid,
-            c_int(property),
-            c_double(min_value),
-            c_double(max_value),
+            property,
+            min_value,
+            max_value,
             byref(c_face_polygons),
         )
 
@@ -516,29 +917,27 @@ class MeshKernel:
             int: The index of node (gap-free array index)
         """
 
-        index = c_int()
-
         (
             x_lower_left,
             y_lower_left,
             x_upper_right,
             y_upper_right,
-        ) = get_maximum_bounding_box_coordinates()
+        ) = _MAXIMUM_BOUNDING_BOX
 
         self._execute_function(
             self.lib.mkernel_mesh2d_get_node_index,
             self._meshkernelid,
-            c_double(x),
-            c_double(y),
-            c_double(search_radius),
-            c_double(x_lower_left),
-            c_double(y_lower_left),
-            c_double(x_upper_right),
-            c_double(y_upper_right),
-            byref(index),
+            x,
+            y,
+            search_radius,
+            x_lower_left,
+            y_lower_left,
+            x_upper_right,
+            y_upper_right,
+            self._scratch_int_ref,
         )
 
-        return index.value
+        return self._scratch_int.value
 
     def mesh2d_get_hanging_edges(self) -> ndarray:
         """Gets the indices of hanging edges. A hanging edge is an edge where one of the two nodes is not connected.
@@ -552,11 +951,10 @@ class MeshKernel:
 
         # Get hanging edges
         hanging_edges = np.empty(number_hanging_edges, dtype=np.int32)
-        c_hanging_edges = np.ctypeslib.as_ctypes(hanging_edges)
         self._execute_function(
             self.lib.mkernel_mesh2d_get_hanging_edges,
             self._meshkernelid,
-            byref(c_hanging_edges),
+            hanging_edges,
         )
 
         return hanging_edges
@@ -570,13 +968,12 @@ class MeshKernel:
         Returns:
             int: The number of hanging edges.
         """
-        c_number_hanging_edges = c_int()
         self._execute_function(
             self.lib.mkernel_mesh2d_count_hanging_edges,
             self._meshkernelid,
-            byref(c_number_hanging_edges),
+            self._scratch_int_ref,
         )
-        return c_number_hanging_edges.value
+        return self._scratch_int.value
 
     def mesh2d_delete_hanging_edges(self) -> None:
         """Delete the hanging edges in the Mesh2d.
@@ -600,8 +997,8 @@ class MeshKernel:
         self._execute_function(
             self.lib.mkernel_mesh2d_make_global,
             self._meshkernelid,
-            c_int(num_longitude_nodes),
-            c_int(num_latitude_nodes),
+            num_longitude_nodes,
+            num_latitude_nodes,
         )
 
     def mesh2d_make_triangular_mesh_from_polygon(self, polygon: GeometryList) -> None:
@@ -716,20 +1113,21 @@ class MeshKernel:
         Returns:
             GeometryList: The refined polygon.
         """
-        c_polygon = CGeometryList.from_geometrylist(polygon)
-        c_n_polygon_nodes = c_int()
-
+        # Both calls take the same leading arguments, only the output differs
+        refinement_args = (
+            self._meshkernelid,
+            byref(CGeometryList.from_geometrylist(polygon)),
+            first_node,
+            second_node,
+            target_edge_length,
+        )
         self._execute_function(
             self.lib.mkernel_polygon_count_refine,
-            self._meshkernelid,
-            byref(c_polygon),
-            c_int(first_node),
-            c_int(second_node),
-            c_double(target_edge_length),
-            byref(c_n_polygon_nodes),
+            *refinement_args,
+            self._scratch_int_ref,
         )
 
-        n_coordinates = c_n_polygon_nodes.value
+        n_coordinates = self._scratch_int.value
 
         x_coordinates = np.empty(n_coordinates, dtype=np.double)
         y_coordinates = np.empty(n_coordinates, dtype=np.double)
@@ -739,11 +1137,7 @@ class MeshKernel:
 
         self._execute_function(
             self.lib.mkernel_polygon_refine,
-            self._meshkernelid,
-            byref(c_polygon),
-            c_int(first_node),
-            c_int(second_node),
-            c_double(target_edge_length),
+            *refinement_args,
             byref(c_refined_polygon),
         )
 
@@ -780,8 +1174,8 @@ class MeshKernel:
             self.lib.mkernel_mesh2d_refine_based_on_samples,
             self._meshkernelid,
             byref(c_samples),
-            c_double(relative_search_radius),
-            c_int(minimum_num_samples),
+            relative_search_radius,
+            minimum_num_samples,
             byref(c_refinement_params),
         )
 
@@ -813,9 +1207,9 @@ class MeshKernel:
             self.lib.mkernel_mesh2d_refine_ridges_based_on_gridded_samples,
             self._meshkernelid,
             byref(c_gridded_samples),
-            c_double(relative_search_radius),
-            c_int(minimum_num_samples),
-            c_int(number_of_smoothing_iterations),
+            relative_search_radius,
+            minimum_num_samples,
+            number_of_smoothing_iterations,
             byref(c_refinement_params),
         )
 
@@ -844,7 +1238,7 @@ class MeshKernel:
             self._meshkernelid,
             byref(c_gridded_samples),
             byref(c_refinement_params),
-            c_int(use_nodal_refinement_int),
+            use_nodal_refinement_int,
         )
 
     def mesh2d_refine_based_on_polygon(
@@ -895,9 +1289,9 @@ class MeshKernel:
         self._execute_function(
             self.lib.mkernel_mesh2d_rotate,
             self._meshkernelid,
-            c_double(centre_x),
-            c_double(centre_y),
-            c_double(angle),
+            centre_x,
+            centre_y,
+            angle,
         )
 
     def mesh2d_translate(self, translation_x: float, translation_y: float) -> None:
@@ -912,8 +1306,8 @@ class MeshKernel:
         self._execute_function(
             self.lib.mkernel_mesh2d_translate,
             self._meshkernelid,
-            c_double(translation_x),
-            c_double(translation_y),
+            translation_x,
+            translation_y,
         )
 
     def polygon_get_included_points(
@@ -977,8 +1371,8 @@ class MeshKernel:
         self._execute_function(
             self.lib.mkernel_mesh2d_flip_edges,
             self._meshkernelid,
-            c_int(triangulation_required),
-            c_int(project_to_land_boundary_required),
+            triangulation_required,
+            project_to_land_boundary_required,
             byref(c_selecting_polygon),
             byref(c_land_boundaries),
         )
@@ -993,15 +1387,13 @@ class MeshKernel:
             int: The number of obtuse triangles.
         """
 
-        n_obtuse_triangles = c_int(0)
-
         self._execute_function(
             self.lib.mkernel_mesh2d_count_obtuse_triangles,
             self._meshkernelid,
-            byref(n_obtuse_triangles),
+            self._scratch_int_ref,
         )
 
-        return n_obtuse_triangles.value
+        return self._scratch_int.value
 
     def mesh2d_get_obtuse_triangles_mass_centers(self) -> GeometryList:
         """Gets the mass centers of obtuse mesh2d triangles.
@@ -1041,15 +1433,14 @@ class MeshKernel:
             int: The number of the small flow edges.
         """
 
-        n_small_flow_edge_centers = c_int()
         self._execute_function(
             self.lib.mkernel_mesh2d_count_small_flow_edge_centers,
             self._meshkernelid,
-            c_double(small_flow_edges_length_threshold),
-            byref(n_small_flow_edge_centers),
+            small_flow_edges_length_threshold,
+            self._scratch_int_ref,
         )
 
-        return n_small_flow_edge_centers.value
+        return self._scratch_int.value
 
     def mesh2d_get_small_flow_edge_centers(
         self, small_flow_edges_length_threshold: float
@@ -1077,7 +1468,7 @@ class MeshKernel:
         self._execute_function(
             self.lib.mkernel_mesh2d_get_small_flow_edge_centers,
             self._meshkernelid,
-            c_double(small_flow_edges_length_threshold),
+            small_flow_edges_length_threshold,
             byref(c_geometry_list),
         )
 
@@ -1101,8 +1492,8 @@ class MeshKernel:
         self._execute_function(
             self.lib.mkernel_mesh2d_delete_small_flow_edges_and_small_triangles,
             self._meshkernelid,
-            c_double(small_flow_edges_length_threshold),
-            c_double(min_fractional_area_triangles),
+            small_flow_edges_length_threshold,
+            min_fractional_area_triangles,
         )
 
     def get_splines(
@@ -1139,7 +1530,7 @@ class MeshKernel:
             self.lib.mkernel_get_splines,
             byref(c_geometry_list_in),
             byref(c_geometry_list_out),
-            c_int(number_of_points_between_nodes),
+            number_of_points_between_nodes,
         )
 
         return geometry_list_out
@@ -1181,13 +1572,12 @@ class MeshKernel:
         Returns:
             int: The number of polygon nodes.
         """
-        number_of_polygon_nodes = c_int()
         self._execute_function(
             self.lib.mkernel_mesh2d_count_mesh_boundaries_as_polygons,
             self._meshkernelid,
-            byref(number_of_polygon_nodes),
+            self._scratch_int_ref,
         )
-        return number_of_polygon_nodes.value
+        return self._scratch_int.value
 
     def mesh2d_merge_nodes(self, geometry_list: GeometryList) -> None:
         """Merges the mesh2d nodes, effectively removing all small edges.
@@ -1216,7 +1606,7 @@ class MeshKernel:
             self.lib.mkernel_mesh2d_merge_nodes_with_merging_distance,
             self._meshkernelid,
             byref(c_geometry_list),
-            c_double(merging_distance),
+            merging_distance,
         )
 
     def mesh2d_merge_two_nodes(self, first_node: int, second_node: int) -> None:
@@ -1230,8 +1620,8 @@ class MeshKernel:
         self._execute_function(
             self.lib.mkernel_mesh2d_merge_two_nodes,
             self._meshkernelid,
-            c_int(first_node),
-            c_int(second_node),
+            first_node,
+            second_node,
         )
 
     def mesh2d_get_nodes_in_polygons(
@@ -1253,7 +1643,6 @@ class MeshKernel:
         )
 
         selected_nodes = np.empty(number_of_mesh_nodes, dtype=np.int32)
-        c_selected_nodes = np.ctypeslib.as_ctypes(selected_nodes)
         c_geometry_list = CGeometryList.from_geometrylist(geometry_list)
 
         # Get selected nodes
@@ -1261,8 +1650,8 @@ class MeshKernel:
             self.lib.mkernel_mesh2d_get_nodes_in_polygons,
             self._meshkernelid,
             byref(c_geometry_list),
-            c_int(inside),
-            c_selected_nodes,
+            inside,
+            selected_nodes,
         )
 
         return selected_nodes
@@ -1279,7 +1668,6 @@ class MeshKernel:
         Returns:
             int: The number of selected nodes
         """
-        c_number_of_mesh_nodes = c_int()
         c_geometry_list = CGeometryList.from_geometrylist(geometry_list)
 
         # Get number of mesh nodes
@@ -1287,10 +1675,10 @@ class MeshKernel:
             self.lib.mkernel_mesh2d_count_nodes_in_polygons,
             self._meshkernelid,
             byref(c_geometry_list),
-            c_int(inside),
-            byref(c_number_of_mesh_nodes),
+            inside,
+            self._scratch_int_ref,
         )
-        return c_number_of_mesh_nodes.value
+        return self._scratch_int.value
 
     def mesh1d_set(self, mesh1d: Mesh1d) -> None:
         """Sets the one-dimensional mesh state of the MeshKernel.
@@ -1428,15 +1816,14 @@ class MeshKernel:
         """
 
         node_mask_int = to_contiguous_numpy_array(node_mask.astype(np.int32))
-        c_node_mask = as_ctypes(node_mask_int)
         c_polygons = CGeometryList.from_geometrylist(polygons)
 
         self._execute_function(
             self.lib.mkernel_contacts_compute_single,
             self._meshkernelid,
-            c_node_mask,
+            node_mask_int,
             byref(c_polygons),
-            c_double(projection_factor),
+            projection_factor,
         )
 
     def contacts_compute_multiple(self, node_mask: ndarray) -> None:
@@ -1449,12 +1836,11 @@ class MeshKernel:
         """
 
         node_mask_int = to_contiguous_numpy_array(node_mask.astype(np.int32))
-        c_node_mask = as_ctypes(node_mask_int)
 
         self._execute_function(
             self.lib.mkernel_contacts_compute_multiple,
             self._meshkernelid,
-            c_node_mask,
+            node_mask_int,
         )
 
     def contacts_compute_with_polygons(
@@ -1470,13 +1856,12 @@ class MeshKernel:
         """
 
         node_mask_int = to_contiguous_numpy_array(node_mask.astype(np.int32))
-        c_node_mask = as_ctypes(node_mask_int)
         c_polygons = CGeometryList.from_geometrylist(polygons)
 
         self._execute_function(
             self.lib.mkernel_contacts_compute_with_polygons,
             self._meshkernelid,
-            c_node_mask,
+            node_mask_int,
             byref(c_polygons),
         )
 
@@ -1493,13 +1878,12 @@ class MeshKernel:
 
         """
         node_mask_int = to_contiguous_numpy_array(node_mask.astype(np.int32))
-        c_node_mask = as_ctypes(node_mask_int)
         c_polygons = CGeometryList.from_geometrylist(polygons)
 
         self._execute_function(
             self.lib.mkernel_contacts_compute_with_points,
             self._meshkernelid,
-            c_node_mask,
+            node_mask_int,
             byref(c_polygons),
         )
 
@@ -1522,15 +1906,14 @@ class MeshKernel:
         """
 
         node_mask_int = to_contiguous_numpy_array(node_mask.astype(np.int32))
-        c_node_mask = as_ctypes(node_mask_int)
         c_polygons = CGeometryList.from_geometrylist(polygons)
 
         self._execute_function(
             self.lib.mkernel_contacts_compute_boundary,
             self._meshkernelid,
-            c_node_mask,
+            node_mask_int,
             byref(c_polygons),
-            c_double(search_radius),
+            search_radius,
         )
 
     def mesh2d_casulli_derefinement(self) -> None:
@@ -1616,7 +1999,7 @@ class MeshKernel:
         self._execute_function(
             self.lib.mkernel_mesh2d_compute_orthogonalization,
             self._meshkernelid,
-            c_int(project_to_land_boundary_option),
+            project_to_land_boundary_option,
             byref(c_orthogonalization_params),
             byref(c_selecting_polygon),
             byref(c_land_boundaries),
@@ -1658,14 +2041,13 @@ class MeshKernel:
         Returns:
             GeometryList: The resulting geometry list containing the value of the properties
         """
-        c_geometry_list_dimension = c_int()
         self._execute_function(
             self.lib.mkernel_mesh2d_get_property_dimension,
             self._meshkernelid,
-            c_int(property),
-            byref(c_geometry_list_dimension),
+            property,
+            self._scratch_int_ref,
         )
-        n_coordinates = c_geometry_list_dimension.value
+        n_coordinates = self._scratch_int.value
         x_coordinates = np.empty(n_coordinates, dtype=np.double)
         y_coordinates = np.empty(n_coordinates, dtype=np.double)
         values = np.empty(n_coordinates, dtype=np.double)
@@ -1676,8 +2058,8 @@ class MeshKernel:
         self._execute_function(
             self.lib.mkernel_mesh2d_get_property,
             self._meshkernelid,
-            c_int(property),
-            c_int(mesh2d_location.value),
+            property,
+            mesh2d_location.value,
             byref(c_property_list),
         )
 
@@ -1723,14 +2105,15 @@ class MeshKernel:
             self.lib.mkernel_mesh2d_connect_meshes,
             self._meshkernelid,
             byref(c_mesh2d),
-            c_double(search_fraction),
+            search_fraction,
         )
 
     def _get_error(self) -> str:
         c_string_size = 512
         c_error_message = create_string_buffer(c_string_size)
         self.lib.mkernel_get_error(c_error_message)
-        return c_error_message.value.decode("ASCII")
+        # Non-ASCII bytes in a message must not hide the error being reported
+        return _ascii_decode(c_error_message.value, "replace")[0]
 
     def _get_geometry_error(self) -> Tuple[int, Mesh2dLocation]:
         """Get geometry error information
@@ -1741,7 +2124,7 @@ class MeshKernel:
         index = c_int()
         location = c_int()
         self.lib.mkernel_get_geometry_error(byref(index), byref(location))
-        return index.value, Mesh2dLocation(location)
+        return index.value, Mesh2dLocation(location.value)
 
     def mesh2d_triangulation_interpolation(
         self,
@@ -1771,7 +2154,7 @@ class MeshKernel:
             self.lib.mkernel_mesh2d_triangulation_interpolation,
             self._meshkernelid,
             byref(c_samples),
-            c_int(location_type),
+            location_type,
             byref(c_interpolated_samples),
         )
 
@@ -1812,10 +2195,10 @@ class MeshKernel:
             self.lib.mkernel_mesh2d_averaging_interpolation,
             self._meshkernelid,
             byref(c_samples),
-            c_int(location_type),
-            c_int(averaging_method),
-            c_double(relative_search_size),
-            c_size_t(min_samples),
+            location_type,
+            averaging_method,
+            relative_search_size,
+            min_samples,
             byref(c_interpolated_samples),
         )
 
@@ -1835,8 +2218,8 @@ class MeshKernel:
         self._execute_function(
             self.lib.mkernel_mesh2d_convert_projection,
             self._meshkernelid,
-            c_int(projection),
-            c_char_p(zone.encode()),
+            projection,
+            zone.encode(),
         )
 
     def get_projection(self) -> ProjectionType:
@@ -1845,12 +2228,13 @@ class MeshKernel:
         Returns:
                    ProjectionType: The projection type
         """
-        projection = c_int()
         self._execute_function(
-            self.lib.mkernel_get_projection, self._meshkernelid, byref(projection)
+            self.lib.mkernel_get_projection,
+            self._meshkernelid,
+            self._scratch_int_ref,
         )
 
-        return ProjectionType(projection.value)
+        return ProjectionType(self._scratch_int.value)
 
     def get_meshkernel_version(self) -> str:
         """Get the version of the underlying C++ MeshKernel library
@@ -1879,8 +2263,6 @@ class MeshKernel:
         Returns:
             float: The separator
         """
-        self.lib.mkernel_get_separator.restype = c_double
-
         return self.lib.mkernel_get_separator()
 
     def mkernel_get_inner_outer_separator(self) -> float:
@@ -1890,8 +2272,6 @@ class MeshKernel:
             float: The polygon inner/outer separator
         """
 
-        self.lib.mkernel_get_inner_outer_separator.restype = c_double
-
         return self.lib.mkernel_get_inner_outer_separator()
 
     def _execute_function(self, function, *args):
@@ -1906,26 +2286,27 @@ class MeshKernel:
                              if the MeshKernel library reports an error.
         """
         exit_code = function(*args)
-        if exit_code != self._exit_code.SUCCESS:
-            error_message = self._get_error()
-            if exit_code == self._exit_code.MESHKERNEL_ERROR:
-                raise MeshKernelError("MeshKernelError", error_message)
-            elif exit_code == self._exit_code.NOT_IMPLEMENTED_ERROR:
-                raise MeshKernelError("NotImplementedError", error_message)
-            elif exit_code == self._exit_code.ALGORITHM_ERROR:
-                raise MeshKernelError("AlgorithmError", error_message)
-            elif exit_code == self._exit_code.CONSTRAINT_ERROR:
-                raise MeshKernelError("ConstraintError", error_message)
-            elif exit_code == self._exit_code.MESH_GEOMETRY_ERROR:
-                raise MeshGeometryError(error_message, self._get_geometry_error())
-            elif exit_code == self._exit_code.LINEAR_ALGEBRA_ERROR:
-                raise MeshKernelError("LinearAlgebraError", error_message)
-            elif exit_code == self._exit_code.RANGE_ERROR:
-                raise MeshKernelError("RangeError", error_message)
-            elif exit_code == self._exit_code.STDLIB_EXCEPTION:
-                raise MeshKernelError("STDLibException", error_message)
-            elif exit_code == self._exit_code.UNKNOWN_EXCEPTION:
-                raise MeshKernelError("UnknownException", error_message)
+        if exit_code != self._success_exit_code:
+            self._raise_error(exit_code)
+
+    def _raise_error(self, exit_code: int) -> None:
+        """Raises the exception matching a failing exit code of a MeshKernel function.
+
+        The error message is only retrieved from the library here, so successful calls never pay for it.
+
+        Args:
+            exit_code (int): The exit code returned by the failing function.
+
+        Raises:
+            MeshGeometryError: If the exit code reports a mesh geometry error.
+            MeshKernelError: If the exit code reports any other error.
+        """
+        error_message = self._get_error()
+        if exit_code == self._exit_code.MESH_GEOMETRY_ERROR:
+            raise MeshGeometryError(error_message, self._get_geometry_error())
+        category = self._error_categories.get(exit_code)
+        if category is not None:
+            raise MeshKernelError(category, error_message)
 
     def _curvilineargrid_get_dimensions(self) -> CCurvilinearGrid:
         """For internal use only.
@@ -2037,12 +2418,11 @@ class MeshKernel:
         num_n = curvilinear_grid_dimensions.num_n
 
         result = np.empty(num_m * num_n, dtype=np.double)
-        c_result = np.ctypeslib.as_ctypes(result)
         self._execute_function(
             self.lib.mkernel_curvilinear_compute_curvature,
             self._meshkernelid,
-            c_int(direction),
-            byref(c_result),
+            direction,
+            result,
         )
         return result
 
@@ -2062,12 +2442,11 @@ class MeshKernel:
         num_n = curvilinear_grid_dimensions.num_n
 
         result = np.empty(num_m * num_n, dtype=np.double)
-        c_result = np.ctypeslib.as_ctypes(result)
         self._execute_function(
             self.lib.mkernel_curvilinear_compute_smoothness,
             self._meshkernelid,
-            c_int(direction),
-            byref(c_result),
+            direction,
+            result,
         )
         return result
 
@@ -2163,11 +2542,11 @@ class MeshKernel:
         self._execute_function(
             self.lib.mkernel_curvilinear_refine,
             self._meshkernelid,
-            c_double(x_lower_left_corner),
-            c_double(y_lower_left_corner),
-            c_double(x_upper_right_corner),
-            c_double(y_upper_right_corner),
-            c_int(refinement),
+            x_lower_left_corner,
+            y_lower_left_corner,
+            x_upper_right_corner,
+            y_upper_right_corner,
+            refinement,
         )
 
     def curvilinear_derefine(
@@ -2190,10 +2569,10 @@ class MeshKernel:
         self._execute_function(
             self.lib.mkernel_curvilinear_derefine,
             self._meshkernelid,
-            c_double(x_lower_left_corner),
-            c_double(y_lower_left_corner),
-            c_double(x_upper_right_corner),
-            c_double(y_upper_right_corner),
+            x_lower_left_corner,
+            y_lower_left_corner,
+            x_upper_right_corner,
+            y_upper_right_corner,
         )
 
     def curvilinear_compute_transfinite_from_polygon(
@@ -2221,10 +2600,10 @@ class MeshKernel:
             self.lib.mkernel_curvilinear_compute_transfinite_from_polygon,
             self._meshkernelid,
             byref(c_geometry_list),
-            c_int(first_node),
-            c_int(second_node),
-            c_int(third_node),
-            c_int(use_fourth_side_int),
+            first_node,
+            second_node,
+            third_node,
+            use_fourth_side_int,
         )
 
     def curvilinear_compute_transfinite_from_triangle(
@@ -2245,8 +2624,11 @@ class MeshKernel:
 
         c_geometry_list = CGeometryList.from_geometrylist(geometry_list)
 
+        # The triangle goes through the polygon entry point with its own argument list.
+        # Indexing the library returns a function object without the declared argtypes,
+        # so the arguments are boxed here.
         self._execute_function(
-            self.lib.mkernel_curvilinear_compute_transfinite_from_polygon,
+            self.lib["mkernel_curvilinear_compute_transfinite_from_polygon"],
             self._meshkernelid,
             byref(c_geometry_list),
             c_int(first_node),
@@ -2294,10 +2676,10 @@ class MeshKernel:
         self._execute_function(
             self.lib.mkernel_curvilinear_set_block_orthogonalize,
             self._meshkernelid,
-            c_double(x_lower_left_corner),
-            c_double(y_lower_left_corner),
-            c_double(x_upper_right_corner),
-            c_double(y_upper_right_corner),
+            x_lower_left_corner,
+            y_lower_left_corner,
+            x_upper_right_corner,
+            y_upper_right_corner,
         )
 
     def curvilinear_set_frozen_lines_orthogonalize(
@@ -2319,10 +2701,10 @@ class MeshKernel:
         self._execute_function(
             self.lib.mkernel_curvilinear_set_frozen_lines_orthogonalize,
             self._meshkernelid,
-            c_double(x_first_gridline_node),
-            c_double(y_first_gridline_node),
-            c_double(x_second_gridline_node),
-            c_double(y_second_gridline_node),
+            x_first_gridline_node,
+            y_first_gridline_node,
+            x_second_gridline_node,
+            y_second_gridline_node,
         )
 
     def curvilinear_orthogonalize(self) -> None:
@@ -2355,11 +2737,11 @@ class MeshKernel:
         self._execute_function(
             self.lib.mkernel_curvilinear_smoothing,
             self._meshkernelid,
-            c_int(smoothing_iterations),
-            c_double(x_lower_left_corner),
-            c_double(y_lower_left_corner),
-            c_double(x_upper_right_corner),
-            c_double(y_upper_right_corner),
+            smoothing_iterations,
+            x_lower_left_corner,
+            y_lower_left_corner,
+            x_upper_right_corner,
+            y_upper_right_corner,
         )
 
     def curvilinear_smoothing_directional(
@@ -2391,15 +2773,15 @@ class MeshKernel:
         self._execute_function(
             self.lib.mkernel_curvilinear_smoothing_directional,
             self._meshkernelid,
-            c_int(smoothing_iterations),
-            c_double(x_first_grid_line_node),
-            c_double(y_first_grid_line_node),
-            c_double(x_second_grid_line_node),
-            c_double(y_second_grid_line_node),
-            c_double(x_lower_left_corner),
-            c_double(y_lower_left_corner),
-            c_double(x_upper_right_corner),
-            c_double(y_upper_right_corner),
+            smoothing_iterations,
+            x_first_grid_line_node,
+            y_first_grid_line_node,
+            x_second_grid_line_node,
+            y_second_grid_line_node,
+            x_lower_left_corner,
+            y_lower_left_corner,
+            x_upper_right_corner,
+            y_upper_right_corner,
         )
 
     def curvilinear_initialize_line_shift(self) -> None:
@@ -2427,10 +2809,10 @@ class MeshKernel:
         self._execute_function(
             self.lib.mkernel_curvilinear_set_line_line_shift,
             self._meshkernelid,
-            c_double(x_first_grid_line_node),
-            c_double(y_first_grid_line_node),
-            c_double(x_second_grid_line_node),
-            c_double(y_second_grid_line_node),
+            x_first_grid_line_node,
+            y_first_grid_line_node,
+            x_second_grid_line_node,
+            y_second_grid_line_node,
         )
 
     def curvilinear_set_block_line_shift(
@@ -2452,10 +2834,10 @@ class MeshKernel:
         self._execute_function(
             self.lib.mkernel_curvilinear_set_block_line_shift,
             self._meshkernelid,
-            c_double(x_lower_left_corner),
-            c_double(y_lower_left_corner),
-            c_double(x_upper_right_corner),
-            c_double(y_upper_right_corner),
+            x_lower_left_corner,
+            y_lower_left_corner,
+            x_upper_right_corner,
+            y_upper_right_corner,
         )
 
     def curvilinear_move_node_line_shift(
@@ -2477,10 +2859,10 @@ class MeshKernel:
         self._execute_function(
             self.lib.mkernel_curvilinear_move_node_line_shift,
             self._meshkernelid,
-            c_double(x_from_coordinate),
-            c_double(y_from_coordinate),
-            c_double(x_to_coordinate),
-            c_double(y_to_coordinate),
+            x_from_coordinate,
+            y_from_coordinate,
+            x_to_coordinate,
+            y_to_coordinate,
         )
 
     def curvilinear_line_shift(self):
@@ -2510,10 +2892,10 @@ class MeshKernel:
         self._execute_function(
             self.lib.mkernel_curvilinear_move_node,
             self._meshkernelid,
-            c_double(x_from_point),
-            c_double(y_from_point),
-            c_double(x_to_point),
-            c_double(y_to_point),
+            x_from_point,
+            y_from_point,
+            x_to_point,
+            y_to_point,
         )
 
     def curvilinear_insert_face(self, x_coordinate: float, y_coordinate: float) -> None:
@@ -2528,8 +2910,8 @@ class MeshKernel:
         self._execute_function(
             self.lib.mkernel_curvilinear_insert_face,
             self._meshkernelid,
-            c_double(x_coordinate),
-            c_double(y_coordinate),
+            x_coordinate,
+            y_coordinate,
         )
 
     def curvilinear_line_attraction_repulsion(
@@ -2560,15 +2942,15 @@ class MeshKernel:
         self._execute_function(
             self.lib.mkernel_curvilinear_line_attraction_repulsion,
             self._meshkernelid,
-            c_double(repulsion_parameter),
-            c_double(x_first_grid_line_node),
-            c_double(y_first_grid_line_node),
-            c_double(x_second_grid_line_node),
-            c_double(y_second_grid_line_node),
-            c_double(x_lower_left_corner),
-            c_double(y_lower_left_corner),
-            c_double(x_upper_right_corner),
-            c_double(y_upper_right_corner),
+            repulsion_parameter,
+            x_first_grid_line_node,
+            y_first_grid_line_node,
+            x_second_grid_line_node,
+            y_second_grid_line_node,
+            x_lower_left_corner,
+            y_lower_left_corner,
+            x_upper_right_corner,
+            y_upper_right_corner,
         )
 
     def curvilinear_line_mirror(
@@ -2591,11 +2973,11 @@ class MeshKernel:
         self._execute_function(
             self.lib.mkernel_curvilinear_line_mirror,
             self._meshkernelid,
-            c_double(mirroring_factor),
-            c_double(x_first_grid_line_node),
-            c_double(y_first_grid_line_node),
-            c_double(x_second_grid_line_node),
-            c_double(y_second_grid_line_node),
+            mirroring_factor,
+            x_first_grid_line_node,
+            y_first_grid_line_node,
+            x_second_grid_line_node,
+            y_second_grid_line_node,
         )
 
     def curvilinear_delete_node(self, x_coordinate: float, y_coordinate: float) -> None:
@@ -2608,8 +2990,8 @@ class MeshKernel:
         self._execute_function(
             self.lib.mkernel_curvilinear_delete_node,
             self._meshkernelid,
-            c_double(x_coordinate),
-            c_double(y_coordinate),
+            x_coordinate,
+            y_coordinate,
         )
 
     def _get_num_coordinates(self, location_type):
@@ -9,6 +9,10 @@ from numpy import ndarray
 import meshkernel.errors as mk_errors
 from meshkernel.utils import plot_edges
 
+# Shared defaults of the omitted array arguments, being empty they cannot be modified through any instance
+_EMPTY_DOUBLE = np.empty(0, dtype=np.double)
+_EMPTY_INT32 = np.empty(0, dtype=np.int32)
+
 
 @unique
 class DeleteMeshOption(IntEnum):
@@ -127,17 +131,17 @@ class Mesh2d:
 
     def __init__(
         self,
-        node_x=np.empty(0, dtype=np.double),
-        node_y=np.empty(0, dtype=np.double),
-        edge_nodes=np.empty(0, dtype=np.int32),
-        face_nodes=np.empty(0, dtype=np.int32),
-        nodes_per_face=np.empty(0, dtype=np.int32),
-        edge_x=np.empty(0, dtype=np.double),
-        edge_y=np.empty(0, dtype=np.double),
-        face_x=np.empty(0, dtype=np.double),
-        face_y=np.empty(0, dtype=np.double),
-        edge_faces=np.empty(0, dtype=np.int32),
-        face_edges=np.empty(0, dtype=np.int32),
+        node_x=_EMPTY_DOUBLE,
+        node_y=_EMPTY_DOUBLE,
+        edge_nodes=_EMPTY_INT32,
+        face_nodes=_EMPTY_INT32,
+        nodes_per_face=_EMPTY_INT32,
+        edge_x=_EMPTY_DOUBLE,
+        edge_y=_EMPTY_DOUBLE,
+        face_x=_EMPTY_DOUBLE,
+        face_y=_EMPTY_DOUBLE,
+        edge_faces=_EMPTY_INT32,
+        face_edges=_EMPTY_INT32,
     ):
         self.node_x: ndarray = np.asarray(node_x, dtype=np.double)
         self.node_y: ndarray = np.asarray(node_y, dtype=np.double)
@@ -285,6 +289,34 @@ class Mesh2d:
             and np.array_equal(self.nodes_per_face, other.nodes_per_face)
         )
 
+    def buffers(self) -> dict:
+        """Describes the memory of the mesh arrays, for handing them to other libraries without a copy.
+
+        Each description is the `__array_interface__` of the array, holding its data address,
+        shape, type string and strides. The described memory is owned by this mesh,
+        so the mesh must be kept alive as long as the memory is used.
+
+        Returns:
+            dict: The array interface description per array name.
+        """
+
+        return {
+            name: getattr(self, name).__array_interface__
+            for name in (
+                "node_x",
+                "node_y",
+                "edge_nodes",
+                "face_nodes",
+                "nodes_per_face",
+                "edge_x",
+                "edge_y",
+                "face_x",
+                "face_y",
+                "edge_faces",
+                "face_edges",
+            )
+        }
+
     def plot_edges(self, ax, *args, **kwargs):
         """Plots the edges at a given axes.
         `args` and `kwargs` will be used as parameters of the `plot` method of matplotlib.
@@ -339,9 +371,9 @@ class GeometryList:
 
     def __init__(
         self,
-        x_coordinates=np.empty(0, dtype=np.double),
-        y_coordinates=np.empty(0, dtype=np.double),
-        values=np.empty(0, dtype=np.double),
+        x_coordinates=_EMPTY_DOUBLE,
+        y_coordinates=_EMPTY_DOUBLE,
+        values=_EMPTY_DOUBLE,
         geometry_separator=-999.0,
         inner_outer_separator=-998.0,
     ):
@@ -361,6 +393,50 @@ class GeometryList:
                 "The length of values is not equal to the length of x_coordinates"
             )
 
+    @classmethod
+    def from_geometries(
+        cls, geometries, geometry_separator=-999.0, inner_outer_separator=-998.0
+    ) -> GeometryList:
+        """Creates a geometry list from separate geometries, placing the geometry separator between them.
+
+        Args:
+            geometries (Iterable[Tuple[ndarray, ndarray]]): The x-coordinates and y-coordinates of each geometry.
+            geometry_separator (float, optional): The value used as a separator in the coordinates.
+                                                  Default is `-999.0`.
+            inner_outer_separator (float, optional): The value used to separate the inner part of a polygon from its
+                                                     outer part. Default is `-998.0`.
+
+        Returns:
+            GeometryList: The geometry list holding all geometries.
+
+        Raises:
+            InputError: Raised when the coordinates of a geometry have different lengths.
+        """
+        geometries = [
+            (np.asarray(x, dtype=np.double), np.asarray(y, dtype=np.double))
+            for x, y in geometries
+        ]
+        if any(x.shape != y.shape for x, y in geometries):
+            raise mk_errors.InputError(
+                "The length of x_coordinates is not equal to the length of y_coordinates"
+            )
+
+        n_coordinates = sum(x.size for x, _ in geometries) + max(len(geometries) - 1, 0)
+        x_coordinates = np.full(n_coordinates, geometry_separator, dtype=np.double)
+        y_coordinates = np.full(n_coordinates, geometry_separator, dtype=np.double)
+        start = 0
+        for x, y in geometries:
+            x_coordinates[start : start + x.size] = x
+            y_coordinates[start : start + y.size] = y
+            start += x.size + 1
+
+        return cls(
+            x_coordinates,
+            y_coordinates,
+            geometry_separator=geometry_separator,
+            inner_outer_separator=inner_outer_separator,
+        )
+
 
 class OrthogonalizationParameters:
     """A class holding the parameters for orthogonalization.
@@ -744,8 +820,8 @@ class GriddedSamples:
         x_origin=0.0,
         y_origin=0.0,
         cell_size=0.0,
-        x_coordinates=np.empty(0, dtype=np.double),
-        y_coordinates=np.empty(0, dtype=np.double),
+        x_coordinates=_EMPTY_DOUBLE,
+        y_coordinates=_EMPTY_DOUBLE,
         values=np.empty(0, dtype=np.float32),
     ):
         self.num_x: int = int(num_x)
@@ -261,6 +261,7 @@ setup(
         "tests": [
             "pytest",
             "pytest-cov",
+            "pytest-xdist",
             "nbval",
         ],
         "lint": [
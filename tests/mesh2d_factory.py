@@ -1,3 +1,6 @@
+from functools import lru_cache
+from typing import Tuple
+
 import numpy as np
 
 from meshkernel import InputError, Mesh2d
@@ -41,45 +44,64 @@ class Mesh2dFactory:
         if spacing_y <= 0:
             raise InputError("`spacing_y` needs to be positive.")
 
+        node_x, node_y, edge_nodes = Mesh2dFactory._create_arrays(
+            rows, columns, origin_x, origin_y, spacing_x, spacing_y
+        )
+
+        return Mesh2d(node_x, node_y, edge_nodes)
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _create_arrays(
+        rows: int,
+        columns: int,
+        origin_x: float,
+        origin_y: float,
+        spacing_x: float,
+        spacing_y: float,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Create the arrays of a rectilinear mesh, see `create`.
+
+        The arrays are cached and shared by all meshes created with the same arguments,
+        so they are read-only.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: The node x-coordinates, node y-coordinates and edge nodes.
+        """
+
         # Convert to node rows and columns
         node_rows = rows + 1
         node_columns = columns + 1
 
         # Initialize helper objects
         num_nodes = node_rows * node_columns
-        indices_values = np.empty((node_rows, node_columns))
+        indices_values = np.arange(num_nodes, dtype=np.int32).reshape(
+            node_rows, node_columns
+        )
 
         # Allocate memory for mesh arrays
-        node_x = np.empty(num_nodes, dtype=np.double)
-        node_y = np.empty(num_nodes, dtype=np.double)
         edge_nodes = np.empty(
             2 * (2 * num_nodes - node_rows - node_columns), dtype=np.int32
         )
 
-        # Calculate node positions
-        node_index = 0
-        for row_index in range(node_rows):
-            for column_index in range(node_columns):
-                node_x[node_index] = column_index * spacing_x + origin_x
-                node_y[node_index] = row_index * spacing_y + origin_y
-                indices_values[row_index, column_index] = (
-                    row_index * node_columns + column_index
-                )
-                node_index += 1
-
-        # Calculate edge indices
-        edge_index = 0
-        for row_index in range(node_rows - 1):
-            for column_index in range(node_columns):
-                edge_nodes[edge_index] = indices_values[row_index, column_index]
-                edge_index += 1
-                edge_nodes[edge_index] = indices_values[row_index + 1, column_index]
-                edge_index += 1
-        for row_index in range(node_rows):
-            for column_index in range(node_columns - 1):
-                edge_nodes[edge_index] = indices_values[row_index, column_index + 1]
-                edge_index += 1
-                edge_nodes[edge_index] = indices_values[row_index, column_index]
-                edge_index += 1
+        # Calculate node positions, row by row
+        node_x = np.tile(
+            np.arange(node_columns, dtype=np.double) * spacing_x + origin_x, node_rows
+        )
+        node_y = np.repeat(
+            np.arange(node_rows, dtype=np.double) * spacing_y + origin_y, node_columns
+        )
+
+        # Calculate edge indices, first the vertical edges upwards,
+        # then the horizontal edges from right to left
+        edge_nodes[0::2] = np.concatenate(
+            [indices_values[:-1, :].ravel(), indices_values[:, 1:].ravel()]
+        )
+        edge_nodes[1::2] = np.concatenate(
+            [indices_values[1:, :].ravel(), indices_values[:, :-1].ravel()]
+        )
 
-        return Mesh2d(node_x, node_y, edge_nodes)
+        for array in (node_x, node_y, edge_nodes):
+            array.setflags(write=False)
+
+        return node_x, node_y, edge_nodes
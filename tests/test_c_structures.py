@@ -1,3 +1,6 @@
+import copy
+import pickle
+
 import numpy as np
 from numpy.ctypeslib import as_array
 from numpy.testing import assert_array_equal
@@ -79,6 +82,24 @@ def test_cmesh2d_from_mesh2d():
     assert c_mesh2d.num_face_nodes == 4
 
 
+def test_cmesh2d_from_mesh2d_converts_arrays():
+    """Tests `from_mesh2d` of the `CMesh2D` class converts arrays of the wrong dtype or layout
+    and passes fitting arrays without a copy."""
+
+    node_x = np.array([0.0, -1.0, 1.0, -1.0, 1.0, -1.0, 0.0], dtype=np.double)[::2]
+    node_y = np.array([0.0, 0.0, 1.0, 1.0], dtype=np.double)
+    edge_nodes = np.array([0, 1, 1, 3, 3, 2, 2, 0], dtype=np.int64)
+
+    mesh2d = Mesh2d(node_x, node_y, edge_nodes)
+    mesh2d.edge_nodes = edge_nodes
+
+    c_mesh2d = CMesh2d.from_mesh2d(mesh2d)
+
+    assert_array_equal(as_array(c_mesh2d.node_x, (4,)), [0.0, 1.0, 1.0, 0.0])
+    assert_array_equal(as_array(c_mesh2d.edge_nodes, (8,)), edge_nodes)
+    assert as_array(c_mesh2d.node_y, (4,)).ctypes.data == node_y.ctypes.data
+
+
 def test_cmesh2d_allocate_memory():
     """Tests `allocate_memory` of the `CMesh2D` class."""
 
@@ -101,6 +122,25 @@ def test_cmesh2d_allocate_memory():
     assert mesh2d.face_y.size == 1
 
 
+def test_cmesh2d_allocate_memory_shares_buffers():
+    """Tests the pointers set by `allocate_memory` of the `CMesh2D` class point into the returned arrays."""
+
+    c_mesh2d = CMesh2d()
+    c_mesh2d.num_nodes = 4
+    c_mesh2d.num_edges = 4
+    c_mesh2d.num_faces = 1
+    c_mesh2d.num_face_nodes = 4
+
+    mesh2d = c_mesh2d.allocate_memory()
+
+    # Write through the C pointers and read back through the NumPy arrays
+    as_array(c_mesh2d.node_x, (4,))[:] = [0.0, 1.0, 1.0, 0.0]
+    as_array(c_mesh2d.edge_nodes, (8,))[:] = [0, 1, 1, 3, 3, 2, 2, 0]
+
+    assert_array_equal(mesh2d.node_x, [0.0, 1.0, 1.0, 0.0])
+    assert_array_equal(mesh2d.edge_nodes, [0, 1, 1, 3, 3, 2, 2, 0])
+
+
 def test_cgeometrylist_from_geometrylist():
     """Tests `from_geometrylist` of the `CGeometryList` class."""
 
@@ -131,6 +171,46 @@ def test_cgeometrylist_from_geometrylist():
     assert c_geometry_list.n_coordinates == x_coordinates.size
 
 
+def test_cgeometrylist_from_geometrylist_converts_sliced_arrays():
+    """Tests `from_geometrylist` passes sliced coordinates of a `GeometryList` as contiguous double arrays."""
+
+    coordinates = np.arange(10, dtype=np.double)
+    geometry_list = GeometryList(coordinates[::2], coordinates[1::2])
+    geometry_list.values = coordinates[::-2]
+
+    c_geometry_list = CGeometryList.from_geometrylist(geometry_list)
+
+    assert_array_equal(
+        as_array(c_geometry_list.x_coordinates, (5,)), [0.0, 2.0, 4.0, 6.0, 8.0]
+    )
+    assert_array_equal(
+        as_array(c_geometry_list.y_coordinates, (5,)), [1.0, 3.0, 5.0, 7.0, 9.0]
+    )
+    assert_array_equal(
+        as_array(c_geometry_list.values, (5,)), [9.0, 7.0, 5.0, 3.0, 1.0]
+    )
+
+
+def test_cgeometrylist_from_geometrylist_leaves_geometrylist_unchanged():
+    """Tests a `GeometryList` can still be copied, pickled and modified in place after `from_geometrylist`."""
+
+    geometry_list = GeometryList(
+        np.array([0.0, 1.0], dtype=np.double), np.array([2.0, 3.0], dtype=np.double)
+    )
+    CGeometryList.from_geometrylist(geometry_list)
+
+    for copied_geometry_list in (
+        copy.deepcopy(geometry_list),
+        pickle.loads(pickle.dumps(geometry_list)),
+    ):
+        assert_array_equal(copied_geometry_list.x_coordinates, [0.0, 1.0])
+        assert_array_equal(copied_geometry_list.y_coordinates, [2.0, 3.0])
+
+    geometry_list.x_coordinates[0] = 4.0
+    c_geometry_list = CGeometryList.from_geometrylist(geometry_list)
+    assert_array_equal(as_array(c_geometry_list.x_coordinates, (2,)), [4.0, 1.0])
+
+
 def test_corthogonalizationparameters_from_orthogonalizationparameters():
     """Tests `from_orthogonalizationparameters` of the `COrthogonalizationParameters` class."""
 
@@ -170,6 +250,22 @@ def test_cmeshrefinementparameters_from_meshrefinementparameters():
     assert c_parameters.account_for_samples_outside_face == 1
 
 
+def test_cmeshrefinementparameters_from_meshrefinementparameters_is_not_shared():
+    """Tests `from_meshrefinementparameters` creates a new C-structure on every call."""
+
+    parameters = MeshRefinementParameters(min_edge_size=0.25)
+
+    c_parameters = CMeshRefinementParameters.from_meshrefinementparameters(parameters)
+    c_parameters.min_edge_size = 0.5
+
+    c_other_parameters = CMeshRefinementParameters.from_meshrefinementparameters(
+        parameters
+    )
+
+    assert c_other_parameters is not c_parameters
+    assert c_other_parameters.min_edge_size == 0.25
+
+
 def test_cmesh1d_from_mesh1d():
     r"""Tests `from_mesh1d` of the `CMesh1D` class with a simple mesh.
 
@@ -17,45 +17,15 @@ def create_meshkernel_instance_with_curvilinear_grid():
     r"""A function for creating an instance of meshkernel with a uniform curvilinear grid."""
     mk = MeshKernel()
 
-    separator = -999.0
-    splines_x = np.array(
+    splines = GeometryList.from_geometries(
         [
-            2.0,
-            4.0,
-            7.0,
-            separator,
-            -1.0,
-            1.0,
-            5.0,
-            separator,
-            3.0,
-            -2.0,
-            separator,
-            7.0,
-            4.0,
-        ],
-        dtype=np.double,
+            ([2.0, 4.0, 7.0], [1.0, 3.0, 4.0]),
+            ([-1.0, 1.0, 5.0], [4.0, 6.0, 7.0]),
+            ([3.0, -2.0], [1.0, 6.0]),
+            ([7.0, 4.0], [3.0, 8.0]),
+        ]
     )
-    splines_y = np.array(
-        [
-            1.0,
-            3.0,
-            4.0,
-            separator,
-            4.0,
-            6.0,
-            7.0,
-            separator,
-            1.0,
-            6.0,
-            separator,
-            3.0,
-            8.0,
-        ],
-        dtype=np.double,
-    )
-    splines_values = np.zeros_like(splines_x)
-    splines = GeometryList(splines_x, splines_y, splines_values)
+    splines.values = np.zeros_like(splines.x_coordinates)
 
     curvilinear_parameters = CurvilinearParameters()
     curvilinear_parameters.n_refinement = 10
@@ -1,3 +1,6 @@
+import gc
+from ctypes import ArgumentError
+
 import numpy as np
 import pytest
 from numpy import ndarray
@@ -38,6 +41,35 @@ def test_different_instances_have_different_ids():
     assert mk_1._meshkernelid != mk_2._meshkernelid
 
 
+def test_different_instances_share_the_library():
+    """Test if two instances use the same library, which is loaded only once"""
+    mk_1 = MeshKernel()
+    mk_2 = MeshKernel()
+
+    assert mk_1.lib is mk_2.lib
+
+
+def test_deleted_instance_deallocates_its_state_once(monkeypatch):
+    """Test if deleting an instance deallocates its state exactly once"""
+    lib = MeshKernel().lib
+    deallocate_state = lib.mkernel_deallocate_state
+    deallocated_ids = []
+
+    def record_deallocate_state(meshkernelid):
+        deallocated_ids.append(meshkernelid)
+        return deallocate_state(meshkernelid)
+
+    # The finalizer takes the deallocation function when the instance is created
+    monkeypatch.setattr(lib, "mkernel_deallocate_state", record_deallocate_state)
+    mk = MeshKernel()
+    meshkernelid = mk._meshkernelid
+
+    del mk
+    gc.collect()
+
+    assert deallocated_ids == [meshkernelid]
+
+
 def test_mesh2d_set_and_mesh2d_get():
     """Test to set a simple mesh and then get it again with new parameters
 
@@ -196,6 +228,15 @@ def test_mesh2d_delete_node_invalid_node_index(meshkernel_with_mesh2d: MeshKerne
         mk.mesh2d_delete_node(-1)
 
 
+def test_mesh2d_delete_node_float_node_index(meshkernel_with_mesh2d: MeshKernel):
+    """Test `mesh2d_delete_node` by passing a float `node_index`, which ctypes rejects for the declared int argument."""
+
+    mk = meshkernel_with_mesh2d(1, 1)
+
+    with pytest.raises(ArgumentError):
+        mk.mesh2d_delete_node(1.5)
+
+
 cases_mesh2d_move_node = [
     (0, 0.0, 0.0),
     (1, 1.0, 0.0),
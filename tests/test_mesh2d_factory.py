@@ -107,6 +107,17 @@ def test_create_rectilinear_mesh_extensive():
     )
 
 
+def test_create_rectilinear_mesh_shares_read_only_arrays():
+    """Tests if `create_rectilinear_mesh` returns new meshes sharing cached read-only arrays."""
+    mesh2d_1 = Mesh2dFactory.create(2, 2)
+    mesh2d_2 = Mesh2dFactory.create(2, 2)
+
+    assert mesh2d_1 is not mesh2d_2
+    assert mesh2d_1.node_x is mesh2d_2.node_x
+    assert not mesh2d_1.node_x.flags.writeable
+    assert not mesh2d_1.edge_nodes.flags.writeable
+
+
 def test_create_rectilinear_mesh_reject_negative_spacing():
     """Tests if `create_rectilinear_mesh` rejects negative spacing."""
     with pytest.raises(InputError):
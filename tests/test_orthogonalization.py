@@ -1,18 +1,81 @@
 import numpy as np
+import pytest
 from mesh2d_factory import Mesh2dFactory
 from numpy.testing import assert_array_equal
-from pytest import approx
 
 from meshkernel import (
     GeometryList,
     Mesh2d,
+    Mesh2dLocation,
+    MeshGeometryError,
     MeshKernel,
     OrthogonalizationParameters,
     ProjectToLandBoundaryOption,
 )
 
+# Deprecation warnings of dependencies are not the subject of these tests
+pytestmark = pytest.mark.filterwarnings("ignore::DeprecationWarning")
 
-def test_mesh2d_compute_orthogonalization():
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    """Marks an array shared by the tests as read-only, so that any modification raises."""
+    array.setflags(write=False)
+    return array
+
+
+# The polygon enclosing the 3x3 Mesh2d and the land boundary along its bottom
+_GRID3X3_POLYGON = GeometryList(
+    _read_only(np.array([-0.1, 2.1, 2.1, -0.1, -0.1], dtype=np.double)),
+    _read_only(np.array([-0.1, -0.1, 2.1, 2.1, -0.1], dtype=np.double)),
+)
+_GRID3X3_LAND_BOUNDARY = GeometryList(
+    _read_only(np.array([0.0, 1.0, 2.0], dtype=np.double)),
+    _read_only(np.array([0.0, 0.0, 0.0], dtype=np.double)),
+)
+
+# The orthogonality of the edges of `Mesh2dFactory.create(2, 2)`,
+# zero for the four inner edges and -999.0 for the boundary edges without an orthogonality
+_FACTORY_2X2_ORTHOGONALITY = np.full(12, -999.0, dtype=np.double)
+_FACTORY_2X2_ORTHOGONALITY[[1, 4, 8, 9]] = 0.0
+_read_only(_FACTORY_2X2_ORTHOGONALITY)
+
+# The edge nodes of the two triangles of the smoothness test
+_TRIANGLES_EDGE_NODES = _read_only(
+    np.array([0, 1, 1, 2, 2, 3, 3, 0, 1, 3], dtype=np.int32)
+)
+
+
+def _mean_orthogonality(values: np.ndarray, invalid_value: float = -999.0) -> float:
+    """Computes the mean orthogonality of the edges, ignoring the edges without a value.
+
+    Args:
+        values (np.ndarray): The orthogonality per edge.
+        invalid_value (float, optional): The value of the edges without orthogonality. Defaults to -999.0.
+
+    Returns:
+        float: The mean orthogonality of the edges with a value.
+    """
+    valid = values != invalid_value
+    return float(values.sum(where=valid) / np.count_nonzero(valid))
+
+
+@pytest.fixture(scope="module")
+def mk():
+    """A MeshKernel instance shared by the tests of this module.
+    Every test sets its own Mesh2d, which replaces the one of the previous test.
+    """
+    return MeshKernel()
+
+
+@pytest.fixture(scope="module")
+def grid3x3():
+    """An orthogonal 3x3 Mesh2d, shared by the tests of this module.
+    Its arrays are read-only, so the tests copy the arrays they modify.
+    """
+    return Mesh2dFactory.create(2, 2)
+
+
+def test_mesh2d_compute_orthogonalization(mk, grid3x3):
     """Tests `mesh2d_compute_orthogonalization` with a 3x3 Mesh2d with an uncentered middle node.
     6---7---8
     |   |   |
@@ -21,45 +84,63 @@ def test_mesh2d_compute_orthogonalization():
     0---1---2
     """
 
-    mk = MeshKernel()
+    node_x = grid3x3.node_x.copy()
+    node_y = grid3x3.node_y.copy()
+    node_x[4] = 1.3
+    node_y[4] = 1.3
 
-    node_x = np.array(
-        [0.0, 1.0, 2.0, 0.0, 1.3, 2.0, 0.0, 1.0, 2.0],
-        dtype=np.double,
-    )
-    node_y = np.array(
-        [0.0, 0.0, 0.0, 1.0, 1.3, 1.0, 2.0, 2.0, 2.0],
-        dtype=np.double,
-    )
-    edge_nodes = np.array(
-        [0, 1, 1, 2, 3, 4, 4, 5, 6, 7, 7, 8, 0, 3, 1, 4, 2, 5, 3, 6, 4, 7, 5, 8],
-        dtype=np.int32,
-    )
-
-    mk.mesh2d_set(Mesh2d(node_x, node_y, edge_nodes))
-
-    polygon_x = np.array([-0.1, 2.1, 2.1, -0.1, -0.1], dtype=np.double)
-    polygon_y = np.array([-0.1, -0.1, 2.1, 2.1, -0.1], dtype=np.double)
-    polygon = GeometryList(polygon_x, polygon_y)
-
-    land_boundary_x = np.array([0.0, 1.0, 2.0], dtype=np.double)
-    land_boundary_y = np.array([0.0, 0.0, 0.0], dtype=np.double)
-    land_boundary = GeometryList(land_boundary_x, land_boundary_y)
+    mk.mesh2d_set(Mesh2d(node_x, node_y, grid3x3.edge_nodes))
 
     mk.mesh2d_compute_orthogonalization(
         project_to_land_boundary_option=ProjectToLandBoundaryOption.DO_NOT_PROJECT_TO_LANDBOUNDARY,
         orthogonalization_parameters=OrthogonalizationParameters(outer_iterations=10),
-        land_boundaries=land_boundary,
-        selecting_polygon=polygon,
+        land_boundaries=_GRID3X3_LAND_BOUNDARY,
+        selecting_polygon=_GRID3X3_POLYGON,
     )
 
     mesh2d = mk.mesh2d_get()
 
-    assert 1.0 <= mesh2d.node_x[4] < 1.3
-    assert 1.0 <= mesh2d.node_y[4] < 1.3
+    middle_node_x = float(mesh2d.node_x[4])
+    middle_node_y = float(mesh2d.node_y[4])
+    assert 1.0 <= middle_node_x < 1.3
+    assert 1.0 <= middle_node_y < 1.3
+
+
+def test_mesh2d_compute_orthogonalization_raises_mesh_geometry_error(mk):
+    """Tests `mesh2d_compute_orthogonalization` raises a `MeshGeometryError` for a fan of 20 triangles,
+    whose center node has too many neighbouring faces.
+    """
+
+    num_triangles = 20
+    angles = np.linspace(0.0, 2.0 * np.pi, num_triangles, endpoint=False)
+    node_x = np.concatenate([[0.0], np.cos(angles)])
+    node_y = np.concatenate([[0.0], np.sin(angles)])
 
+    # Each triangle adds a spoke from the center node and a rim edge to the next outer node
+    outer_nodes = np.arange(1, num_triangles + 1, dtype=np.int32)
+    edge_nodes = np.empty(4 * num_triangles, dtype=np.int32)
+    edge_nodes[0::4] = 0
+    edge_nodes[1::4] = outer_nodes
+    edge_nodes[2::4] = outer_nodes
+    edge_nodes[3::4] = np.roll(outer_nodes, -1)
+
+    mk.mesh2d_set(Mesh2d(node_x, node_y, edge_nodes))
 
-def test_mesh2d_get_orthogonality_orthogonal_mesh2d():
+    with pytest.raises(MeshGeometryError) as error:
+        mk.mesh2d_compute_orthogonalization(
+            project_to_land_boundary_option=ProjectToLandBoundaryOption.DO_NOT_PROJECT_TO_LANDBOUNDARY,
+            orthogonalization_parameters=OrthogonalizationParameters(
+                outer_iterations=1
+            ),
+            land_boundaries=GeometryList(),
+            selecting_polygon=GeometryList(),
+        )
+
+    assert error.value.index() == 0
+    assert error.value.location() == Mesh2dLocation.NODES
+
+
+def test_mesh2d_get_orthogonality_orthogonal_mesh2d(mk):
     """Tests `mesh2d_get_orthogonality` with an orthogonal 2x2 Mesh2d.
     6---7---8
     |   |   |
@@ -68,35 +149,16 @@ def test_mesh2d_get_orthogonality_orthogonal_mesh2d():
     0---1---2
     """
 
-    mk = MeshKernel()
     mk.mesh2d_set(Mesh2dFactory.create(2, 2))
 
     orthogonality = mk.mesh2d_get_orthogonality()
 
     assert orthogonality.values.size == 12
 
-    exp_orthogonality = np.array(
-        [
-            -999.0,
-            0.0,
-            -999.0,
-            -999.0,
-            0.0,
-            -999.0,
-            -999.0,
-            -999.0,
-            0.0,
-            0.0,
-            -999.0,
-            -999.0,
-        ],
-        dtype=np.double,
-    )
-
-    assert_array_equal(orthogonality.values, exp_orthogonality)
+    assert_array_equal(orthogonality.values, _FACTORY_2X2_ORTHOGONALITY)
 
 
-def test_mesh2d_get_orthogonality_not_orthogonal_mesh2d():
+def test_mesh2d_get_orthogonality_not_orthogonal_mesh2d(mk, grid3x3):
     """Tests `mesh2d_get_orthogonality` with a non-orthogonal 3x3 Mesh2d.
     6---7---8
     |   |   |
@@ -105,42 +167,26 @@ def test_mesh2d_get_orthogonality_not_orthogonal_mesh2d():
     0---1---2
     """
 
-    mk = MeshKernel()
+    node_x = grid3x3.node_x.copy()
+    node_y = grid3x3.node_y.copy()
+    node_x[4] = 1.8
+    node_y[4] = 1.8
 
-    node_x = np.array(
-        [0.0, 1.0, 2.0, 0.0, 1.8, 2.0, 0.0, 1.0, 2.0],
-        dtype=np.double,
-    )
-    node_y = np.array(
-        [0.0, 0.0, 0.0, 1.0, 1.8, 1.0, 2.0, 2.0, 2.0],
-        dtype=np.double,
-    )
-    edge_nodes = np.array(
-        [0, 1, 1, 2, 3, 4, 4, 5, 6, 7, 7, 8, 0, 3, 1, 4, 2, 5, 3, 6, 4, 7, 5, 8],
-        dtype=np.int32,
-    )
-
-    mk.mesh2d_set(Mesh2d(node_x, node_y, edge_nodes))
+    mk.mesh2d_set(Mesh2d(node_x, node_y, grid3x3.edge_nodes))
 
     orthogonality = mk.mesh2d_get_orthogonality()
 
     assert orthogonality.values.size == 12
 
-    assert orthogonality.values[0] == -999.0
-    assert orthogonality.values[1] == -999.0
-    assert orthogonality.values[2] > 0.0
-    assert orthogonality.values[3] > 0.0
-    assert orthogonality.values[4] == -999.0
-    assert orthogonality.values[5] == -999.0
-    assert orthogonality.values[6] == -999.0
-    assert orthogonality.values[7] > 0.0
-    assert orthogonality.values[8] == -999.0
-    assert orthogonality.values[9] == -999.0
-    assert orthogonality.values[10] > 0.0
-    assert orthogonality.values[11] == -999.0
-
-
-def test_mesh2d_get_smoothness_smooth_mesh2d():
+    # Only the edges connected to the displaced middle node are not orthogonal
+    boundary_edges = [0, 2, 3, 5, 6, 7, 10, 11]
+    inner_edges = [1, 4, 8, 9]
+    assert np.all(orthogonality.values[boundary_edges] == -999.0)
+    assert np.all(orthogonality.values[inner_edges] > 0.0)
+    assert _mean_orthogonality(orthogonality.values) > 0.0
+
+
+def test_mesh2d_get_smoothness_smooth_mesh2d(mk):
     r"""Tests `mesh2d_get_smoothness` with a simple triangular Mesh2d.
 
       3---2
@@ -148,8 +194,6 @@ def test_mesh2d_get_smoothness_smooth_mesh2d():
     0---1
     """
 
-    mk = MeshKernel()
-
     node_x = np.array(
         [0.0, 4.0, 6.0, 2.0, 2.0],
         dtype=np.double,
@@ -158,19 +202,11 @@ def test_mesh2d_get_smoothness_smooth_mesh2d():
         [0.0, 0.0, 3.0, 3.0, 1.0],
         dtype=np.double,
     )
-    edge_nodes = np.array(
-        [0, 1, 1, 2, 2, 3, 3, 0, 1, 3],
-        dtype=np.int32,
-    )
-
-    mk.mesh2d_set(Mesh2d(node_x, node_y, edge_nodes))
+    mk.mesh2d_set(Mesh2d(node_x, node_y, _TRIANGLES_EDGE_NODES))
 
     smoothness = mk.mesh2d_get_smoothness()
 
     assert smoothness.values.size == 5
 
-    assert smoothness.values[0] == -999.0
-    assert smoothness.values[1] == -999.0
-    assert smoothness.values[2] == -999.0
-    assert smoothness.values[3] == -999.0
-    assert smoothness.values[4] == approx(1.0, abs=0.01)
+    assert np.all(smoothness.values[:4] == -999.0)
+    assert abs(smoothness.values[4] - 1.0) <= 0.01
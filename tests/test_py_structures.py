@@ -1,5 +1,6 @@
 import numpy as np
 import pytest
+from numpy.testing import assert_array_equal
 
 from meshkernel import (
     AveragingMethod,
@@ -138,6 +139,31 @@ def test_mesh2d_almost_equal():
     assert not mesh2d_1.almost_equal(mesh2d_2, rtol=0.0, atol=1.0e-7)
 
 
+def test_mesh2d_buffers():
+    """Tests `buffers` of the `Mesh2d` class describes the memory of the mesh arrays."""
+
+    node_x = np.array([0.0, 1.0, 1.0, 0.0], dtype=np.double)
+    node_y = np.array([0.0, 0.0, 1.0, 1.0], dtype=np.double)
+    edge_nodes = np.array([0, 1, 1, 2, 2, 3, 3, 0], dtype=np.int32)
+
+    mesh2d = Mesh2d(node_x, node_y, edge_nodes)
+    buffers = mesh2d.buffers()
+
+    assert buffers["node_x"]["data"][0] == node_x.ctypes.data
+    assert buffers["edge_nodes"]["shape"] == (8,)
+    assert buffers["edge_nodes"]["typestr"] == np.dtype(np.int32).str
+    assert buffers["face_nodes"]["shape"] == (0,)
+
+    # A consumer of the descriptions sees the memory of the mesh
+    class _Buffer:
+        def __init__(self, interface):
+            self.__array_interface__ = interface
+
+    view = np.asarray(_Buffer(buffers["node_y"]))
+    view[0] = 5.0
+    assert mesh2d.node_y[0] == 5.0
+
+
 def test_geometrylist_constructor():
     """Tests the default values after constructing a `GeometryList`."""
 
@@ -152,6 +178,23 @@ def test_geometrylist_constructor():
     assert geometry_list.inner_outer_separator == -998.0
 
 
+def test_geometrylist_from_geometries():
+    """Tests `GeometryList.from_geometries` separates the geometries with the geometry separator."""
+
+    geometry_list = GeometryList.from_geometries(
+        [([2.0, 4.0, 7.0], [1.0, 3.0, 4.0]), ([3.0, -2.0], [1.0, 6.0])],
+        geometry_separator=-999.0,
+    )
+
+    assert_array_equal(geometry_list.x_coordinates, [2.0, 4.0, 7.0, -999.0, 3.0, -2.0])
+    assert_array_equal(geometry_list.y_coordinates, [1.0, 3.0, 4.0, -999.0, 1.0, 6.0])
+    assert geometry_list.geometry_separator == -999.0
+    assert geometry_list.values.size == 0
+
+    with pytest.raises(InputError):
+        GeometryList.from_geometries([([0.0, 1.0], [0.0])])
+
+
 def test_geometrylist_constructor_raises_exception():
     """Tests `GeometryList` constructor raises an exception when coordinates and values have different lengths."""
 